@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from contextlib import asynccontextmanager
+from collections import deque
 from dotenv import load_dotenv
 import subprocess
 import traceback
@@ -28,6 +29,9 @@ import uvicorn
 import base64
 from fastapi.responses import JSONResponse
 import uuid
+import hashlib
+import re
+import zipfile
 from fastmcp import Client
 
 # Import database components
@@ -40,6 +44,44 @@ from centralized_logging import get_logger, log_api_request, log_service_start,
 # Configure logging
 logger = get_logger("api_bridge")
 
+# Automation log batching: entries are queued by request handlers and
+# written by a background task in batches of up to LOG_BATCH_SIZE
+LOG_BATCH_SIZE = 100
+LOG_BATCH_INTERVAL = 0.2  # seconds
+
+async def _log_worker(queue: asyncio.Queue, db: DatabaseManager, unwritten: List[Dict[str, Any]]):
+    """Drain queued automation log entries into the database in batches.
+
+    On cancellation, entries already taken off the queue are appended to
+    `unwritten` for the caller to write.
+    """
+    while True:
+        batch = [await queue.get()]
+        deadline = time.monotonic() + LOG_BATCH_INTERVAL
+        try:
+            while len(batch) < LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Shutdown: hand back what we already pulled off the queue
+            unwritten.extend(batch)
+            raise
+        await asyncio.to_thread(db.log_automation_actions_bulk, batch)
+
+def queue_automation_log(db: DatabaseManager, **entry):
+    """Queue an automation log entry, writing it directly if no worker is running"""
+    entry.setdefault("timestamp", datetime.now())
+    log_q = getattr(app.state, "log_q", None)
+    if log_q is None:
+        db.log_automation_actions_bulk([entry])
+    else:
+        log_q.put_nowait(entry)
+
 # Load service ports configuration
 def load_service_ports():
     """Load service ports from configuration file"""
@@ -87,10 +129,22 @@ async def lifespan(app: FastAPI):
             db.log_automation_action(user_id=user_id, action="startup", success=False, details={"error": str(e)})
         raise
     
+    app.state.log_q = asyncio.Queue()
+    pending_logs: List[Dict[str, Any]] = []
+    log_task = asyncio.create_task(_log_worker(app.state.log_q, db, pending_logs))
+    
     yield
     
     # Shutdown
     logger.log_info("Shutting down API...")
+    log_task.cancel()
+    # Wait for the worker to stop so its partial batch lands in pending_logs
+    # before the queue is drained and the shutdown row is written
+    await asyncio.gather(log_task, return_exceptions=True)
+    while not app.state.log_q.empty():
+        pending_logs.append(app.state.log_q.get_nowait())
+    app.state.log_q = None
+    await asyncio.to_thread(db.log_automation_actions_bulk, pending_logs)
     try:
         # Log shutdown action
         user_id = db.get_user("default_user")
@@ -875,7 +929,8 @@ async def login_linkedin_secure(request: dict = Body(None), user: dict = Depends
                 detail="LinkedIn credentials not configured. Please set LINKEDIN_USERNAME and LINKEDIN_PASSWORD environment variables or provide them in the request body."
             )
         # Log the login attempt
-        db.log_automation_action(
+        queue_automation_log(
+            db,
             user_id=user["id"],
             action="login_attempt",
             success=True,
@@ -895,7 +950,8 @@ async def login_linkedin_secure(request: dict = Body(None), user: dict = Depends
         logger.log_error(f"Error in login_linkedin_secure: {e}", e)
         # Log the failed attempt
         try:
-            db.log_automation_action(
+            queue_automation_log(
+                db,
                 user_id=user["id"],
                 action="login_attempt",
                 success=False,
@@ -905,12 +961,67 @@ async def login_linkedin_secure(request: dict = Body(None), user: dict = Depends
             pass
         raise HTTPException(status_code=500, detail="Login failed. Please try again.")
 
+RESUME_DIR = "resumes"
+
+# Resume ids are drawn from a pool filled by one os.urandom call per
+# UUID_POOL_SIZE ids instead of one entropy read per upload
+UUID_POOL_SIZE = 1024
+_uuid_pool = deque()
+
+def _next_resume_id() -> str:
+    """Return a random (version 4) UUID string from the pre-generated pool"""
+    if not _uuid_pool:
+        entropy = os.urandom(16 * UUID_POOL_SIZE)
+        _uuid_pool.extend(
+            str(uuid.UUID(bytes=entropy[i:i + 16], version=4))
+            for i in range(0, len(entropy), 16)
+        )
+    return _uuid_pool.popleft()
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks = set()
+
+def _write_resume_file(file_path: str, content_bytes: bytes):
+    """Write a resume in one pass through a raw file descriptor"""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(content_bytes)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _count_resume_words(file_path: str) -> Optional[int]:
+    """Best-effort word count for binary resume formats, None when it cannot be parsed"""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext == '.docx':
+        with zipfile.ZipFile(file_path) as docx:
+            xml = docx.read('word/document.xml').decode('utf-8', errors='replace')
+        return len(" ".join(re.findall(r'<w:t[^>]*>([^<]*)</w:t>', xml)).split())
+    if file_ext == '.pdf':
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return None
+        return sum(len((page.extract_text() or "").split()) for page in PdfReader(file_path).pages)
+    return None
+
+async def _extract_words(db: DatabaseManager, file_path: str):
+    """Background task: store the real word count of an uploaded binary resume"""
+    try:
+        word_count = await asyncio.to_thread(_count_resume_words, file_path)
+    except Exception as e:
+        logger.log_warning(f"Could not extract words from {file_path}: {e}")
+        return
+    if word_count is not None:
+        await asyncio.to_thread(db.update_resume_word_count, file_path, word_count)
+
 # Add /api/resume/upload endpoint
 @app.post("/api/resume/upload")
 async def upload_resume(request: ResumeUploadRequest, user: dict = Depends(get_current_user), db: DatabaseManager = Depends(get_db_manager)):
     try:
         allowed_extensions = {'.pdf', '.doc', '.docx', '.txt'}
-        file_ext = Path(request.filename).suffix.lower()
+        file_ext = os.path.splitext(request.filename)[1].lower()
         word_count = 0
         if file_ext not in allowed_extensions:
             return JSONResponse(status_code=400, content={
@@ -920,11 +1031,9 @@ async def upload_resume(request: ResumeUploadRequest, user: dict = Depends(get_c
                 "word_count": word_count
             })
 
-        resume_dir = Path("resumes")
-        resume_dir.mkdir(exist_ok=True)
-        resume_id = str(uuid.uuid4())
-        new_filename = f"{resume_id}{file_ext}"
-        file_path = resume_dir / new_filename
+        os.makedirs(RESUME_DIR, exist_ok=True)
+        resume_id = _next_resume_id()
+        file_path = os.path.join(RESUME_DIR, f"{resume_id}{file_ext}")
 
         try:
             content_bytes = base64.b64decode(request.content)
@@ -944,20 +1053,23 @@ async def upload_resume(request: ResumeUploadRequest, user: dict = Depends(get_c
                 "word_count": word_count
             })
 
-        with open(file_path, "wb") as f:
-            f.write(content_bytes)
+        await asyncio.to_thread(_write_resume_file, file_path, content_bytes)
 
-        # Word count logic
+        # Word count: plain text is counted inline, binary formats are parsed in the background
         if file_ext == '.txt':
             try:
                 word_count = len(content_bytes.decode('utf-8').split())
             except UnicodeDecodeError:
                 word_count = -1
         else:
-            word_count = len(content_bytes) // 5  # Rough estimate for binary
+            word_count = None
 
         user_id = user['id']
-        db.update_user(username=user['username'], resume_url=str(file_path))
+        db.update_user(username=user['username'], resume_url=file_path, resume_word_count=word_count)
+        if word_count is None:
+            task = asyncio.create_task(_extract_words(db, file_path))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
         upload_date = datetime.now().isoformat()
 
         return JSONResponse(status_code=200, content={
@@ -965,7 +1077,7 @@ async def upload_resume(request: ResumeUploadRequest, user: dict = Depends(get_c
             "resume_id": resume_id,
             "filename": request.filename,
             "upload_date": upload_date,
-            "content": request.content,
+            "sha256": hashlib.sha256(content_bytes).hexdigest(),
             "word_count": word_count,
             "message": "Resume uploaded successfully"
         })
@@ -11,15 +11,53 @@ from dataclasses import dataclass, asdict, field
 from pathlib import Path
 import centralized_logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 central_logger = centralized_logging.get_logger("apply_to_jobs")
 
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+class AsyncTokenBucket:
+    """Async token bucket: allows `rate` acquisitions per `period` seconds, bursting up to `burst`."""
+
+    def __init__(self, rate: float, period: float = 60.0, burst: int = 1):
+        self.fill_rate = rate / period
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+            self.updated_at = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+                self.tokens = 1.0
+                self.updated_at = time.monotonic()
+            self.tokens -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 class JobApplicationManager:
     """Handles the job application phase."""
     
-    def __init__(self, api_base_url: str | None = None):
+    def __init__(self, api_base_url: str | None = None, applications_per_minute: float = 20,
+                 max_concurrent_applications: int = 3):
         try:
-            with open('service_ports.json', 'r') as f:
-                ports = json.load(f)
+            ports = _json_loads(Path('service_ports.json').read_bytes())
             job_mgmt_port = ports.get('job_management_api', 8006)
         except:
             job_mgmt_port = 8006
@@ -32,6 +70,9 @@ class JobApplicationManager:
             "total_runtime": 0,
             "errors": 0
         }
+        # Shared pacing for every application made through this manager
+        self.limiter = AsyncTokenBucket(applications_per_minute, period=60)
+        self.max_concurrent_applications = max_concurrent_applications
 
     async def run_application_phase(self, max_applications: int = 20):
         """Phase 2: Fetch jobs from the database and apply to them."""
@@ -42,37 +83,53 @@ class JobApplicationManager:
             central_logger.log_info("No new jobs to apply for in this cycle.")
             return
 
-        applied_count = 0
+        jobs = []
         for job in jobs_to_apply:
-            if applied_count >= max_applications:
-                central_logger.log_info("Reached max application limit for this cycle.")
-                break
-            
-            job_id = job.get('job_id')
-            if not job_id:
+            if not job.get('job_id'):
                 central_logger.log_warning("Skipping job with no job_id.")
                 continue
+            if len(jobs) >= max_applications:
+                central_logger.log_info("Reached max application limit for this cycle.")
+                break
+            jobs.append(job)
 
-            central_logger.log_info(f"Applying to: {job.get('title')} ({job_id})")
-            
-            await self._update_job_status(job_id, 'applying')
-            
-            # This is where the real application automation would happen.
-            # For now, we'll simulate it.
-            await asyncio.sleep(5) 
-            application_successful = True 
-            error_message = None
-            
-            if application_successful:
-                await self._update_job_status(job_id, 'applied')
-                self.application_stats['jobs_applied'] += 1
-                applied_count += 1
-            else:
-                await self._update_job_status(job_id, 'error', error_message)
+        # Applications are independent and I/O bound, so a few run at once;
+        # the rate limiter still paces how often a new one may start
+        semaphore = asyncio.Semaphore(self.max_concurrent_applications)
+
+        async def apply_bounded(job: Dict) -> bool:
+            async with semaphore:
+                return await self._apply_to_job(job)
+
+        results = await asyncio.gather(*(apply_bounded(job) for job in jobs), return_exceptions=True)
+        for job, result in zip(jobs, results):
+            if isinstance(result, Exception):
+                central_logger.log_error(f"Application to {job['job_id']} raised: {result}")
                 self.application_stats['errors'] += 1
-        
+
         central_logger.log_info(f"--- Application Phase Completed Successfully ---")
 
+    async def _apply_to_job(self, job: Dict) -> bool:
+        """Apply to a single job and record the outcome via the job management API."""
+        job_id = job['job_id']
+        central_logger.log_info(f"Applying to: {job.get('title')} ({job_id})")
+
+        await self._update_job_status(job_id, 'applying')
+
+        # This is where the real application automation would happen.
+        # For now, we'll simulate it, paced by the rate limiter.
+        async with self.limiter:
+            application_successful = True
+        error_message = None
+
+        if application_successful:
+            await self._update_job_status(job_id, 'applied')
+            self.application_stats['jobs_applied'] += 1
+        else:
+            await self._update_job_status(job_id, 'error', error_message)
+            self.application_stats['errors'] += 1
+        return application_successful
+
     async def _get_jobs_by_status(self, status: str, limit: int) -> List[Dict]:
         """Helper to get jobs from the job management API."""
         try:
@@ -80,7 +137,7 @@ class JobApplicationManager:
                 url = f"{self.job_management_api_base_url}/api/jobs/status/{status}?limit={limit}"
                 async with session.get(url) as response:
                     if response.status == 200:
-                        return await response.json()
+                        return _json_loads(await response.read())
                     else:
                         central_logger.log_error(f"Failed to get jobs with status {status}. API returned {response.status}")
                         return []
@@ -4,43 +4,181 @@ Automated Startup Script for LinkedIn Job Hunter
 Handles all manual intervention scenarios automatically
 """
 
+import asyncio
 import os
 import sys
 import time
 import subprocess
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 import psutil
+import queue
+import re
+import selectors
 import signal
+import socket
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import List, Optional, Tuple
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import shutil
+import functools
+import fnmatch
+import hashlib
 import json
+import logging
 import centralized_logging
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 import port_manager
 
+# Native inotify on Linux; watchdog covers every other platform
+INOTIFY_AVAILABLE = False
+if sys.platform == 'linux':
+    try:
+        from asyncinotify import Inotify, Mask
+        INOTIFY_AVAILABLE = True
+    except ImportError:
+        pass
+
 # Configure logging
 logger = centralized_logging.get_logger("auto_startup")
 
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    """shutil.which, memoized so each executable's PATH walk happens once per process"""
+    return shutil.which(name)
+
+def _log_path():
+    """Dump PATH for diagnosing missing executables; it is long, so only at DEBUG level"""
+    if logger.logger.isEnabledFor(logging.DEBUG):
+        logger.logger.debug(f"PATH: {os.environ.get('PATH')}")
+
+# Children get their own session. Descriptors are non-inheritable by default
+# (PEP 446), so close_fds=False leaks nothing and skips the per-spawn loop that
+# closes every descriptor up to the fd limit in the child
+SPAWN_OPTIONS = {'start_new_session': True, 'close_fds': False}
+
+class _LogPump:
+    """Forwards child process output lines to the logger from a single selector thread"""
+
+    batch_size = 100
+    batch_interval = 0.05  # seconds
+
+    def __init__(self):
+        # Windows selectors only accept sockets, so pipes get a reader thread each there
+        self._use_threads = os.name == 'nt'
+        self._selector = None if self._use_threads else selectors.DefaultSelector()
+        self._thread = None
+        self._lock = threading.Lock()
+        # Readers only enqueue lines; one flusher thread talks to the logger
+        self._lines = queue.Queue()
+        self._flusher = None
+
+    def register(self, stream, tag: str, log_func):
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush, name="log-flush", daemon=True)
+                self._flusher.start()
+            if self._use_threads:
+                threading.Thread(target=self._drain, args=(stream, tag, log_func), daemon=True).start()
+                return
+            self._selector.register(stream, selectors.EVENT_READ, (tag, log_func, bytearray()))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-pump", daemon=True)
+                self._thread.start()
+
+    def _emit(self, tag: str, log_func, raw: bytes):
+        self._lines.put((tag, log_func, raw))
+
+    def _flush(self):
+        while True:
+            batch = [self._lines.get()]
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._lines.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            for tag, log_func, raw in batch:
+                log_func(f"[{tag}] {raw.decode('utf-8', errors='replace').strip()}")
+
+    def _drain(self, stream, tag: str, log_func):
+        for raw in iter(stream.readline, b''):
+            self._emit(tag, log_func, raw)
+
+    def _run(self):
+        while True:
+            # The timeout lets streams registered after select() started be picked up
+            for key, _ in self._selector.select(timeout=0.5):
+                tag, log_func, pending = key.data
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    with self._lock:
+                        self._selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    if pending:
+                        self._emit(tag, log_func, bytes(pending))
+                    continue
+                pending += chunk
+                *lines, rest = pending.split(b'\n')
+                pending[:] = rest
+                for raw in lines:
+                    self._emit(tag, log_func, raw)
+
 class AutoStartup:
+    # (script, service name) for the Python services launched by run()
+    python_services = (
+        ('api_bridge_with_database.py', 'api_bridge'),
+        ('linkedin_browser_mcp.py', 'mcp_backend'),
+        ('llm_controller.py', 'llm_controller'),
+    )
+
+    # Unique port ranges for each service
+    SERVICE_PORT_RANGES = {
+        'api_bridge': range(8001, 8011),
+        'mcp_backend': range(8101, 8111),
+        'llm_controller': range(8201, 8211),
+        'react_frontend': range(3000, 3010),
+    }
+
     def __init__(self):
-        # Unique port ranges for each service
-        self.service_port_ranges = {
-            'api_bridge': list(range(8001, 8011)),
-            'mcp_backend': list(range(8101, 8111)),
-            'llm_controller': list(range(8201, 8211)),
-            'react_frontend': list(range(3000, 3010)),
-        }
         self.services = {
-            'api_bridge': {'script': 'api_bridge.py', 'process': None, 'port': None},
-            'mcp_backend': {'script': 'linkedin_browser_mcp.py', 'process': None, 'port': None},
-            'llm_controller': {'script': 'llm_controller.py', 'process': None, 'port': None},
-            'react_frontend': {'script': 'npm start', 'process': None, 'port': None},
+            'api_bridge': {'script': 'api_bridge.py', 'process': None, 'port': None, 'ready_future': None},
+            'mcp_backend': {'script': 'linkedin_browser_mcp.py', 'process': None, 'port': None, 'ready_future': None},
+            'llm_controller': {'script': 'llm_controller.py', 'process': None, 'port': None, 'ready_future': None},
+            'react_frontend': {'script': 'npm start', 'process': None, 'port': None, 'ready_future': None},
         }
         self.max_port_attempts = 10
+        # Seconds each spawned Python service gets to answer /health in run()
+        self.readiness_timeout = 60
+        # Cached port -> pid snapshot shared by consecutive kill_process_on_port calls
+        self.port_snapshot_ttl = 5.0
+        self._port_pids = None
+        self._port_pids_at = 0.0
+        self._listening_ports = set()
+        # port -> (available, checked_at) so repeated scans don't re-probe the same ports
+        self.port_cache_ttl = 2.0
+        self._port_cache = {}
+        # Guards port selection and service_ports.json while services start concurrently
+        self._port_lock = threading.Lock()
+        self._ports_dirty = False
+        self._log_pump = _LogPump()
+        # Set whenever a child process exits, so supervision can sleep until then
+        self._child_died = threading.Event()
+        # Pooled keep-alive connections for every health/readiness probe
+        self._session = requests.Session()
+        self._session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
         self.ports_file = Path(__file__).parent / 'service_ports.json'
+        # Successful node/npm version checks, keyed on the binaries' paths and mtime
+        self.startup_cache_file = Path(__file__).parent / '.startup_cache.json'
+        # Hash of the package-lock.json that the last successful npm install used
+        self.npm_install_stamp = Path(__file__).parent / '.npm_install_stamp'
         self.load_ports()
         
     def load_ports(self):
@@ -54,109 +192,298 @@ class AutoStartup:
             self.saved_ports = {}
 
     def save_ports(self):
-        ports = {svc: info['port'] for svc, info in self.services.items() if info['port']}
-        with open(self.ports_file, 'w') as f:
-            json.dump(ports, f, indent=2)
+        """Mark the port assignments as changed; written out by flush_ports()"""
+        self._ports_dirty = True
+
+    def flush_ports(self):
+        """Write service_ports.json once, atomically, if any assignment changed"""
+        with self._port_lock:
+            if not self._ports_dirty:
+                return
+            ports = {svc: info['port'] for svc, info in self.services.items() if info['port']}
+            tmp_file = self.ports_file.with_name(self.ports_file.name + '.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(ports, f)
+            os.replace(tmp_file, self.ports_file)
+            self._ports_dirty = False
 
     def check_port_available(self, port: int) -> bool:
-        """Check if a port is available"""
+        """Check if a port is available: bindable for TCP and UDP on all interfaces, and not answering"""
+        cached = self._port_cache.get(port)
+        if cached and time.monotonic() - cached[1] < self.port_cache_ttl:
+            return cached[0]
+        available = self._probe_port(port)
+        self._port_cache[port] = (available, time.monotonic())
+        return available
+
+    @staticmethod
+    def _probe_port(port: int) -> bool:
         try:
-            import socket
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('localhost', port))
-                return True
-        except OSError:
+                if os.name != 'nt':
+                    # Only tolerates TIME_WAIT leftovers on POSIX; on Windows it would allow port stealing
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.bind(('0.0.0.0', port))
+                s.listen(1)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.bind(('0.0.0.0', port))
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.settimeout(0.05)
+                return s.connect_ex(('127.0.0.1', port)) != 0
+        except (OSError, OverflowError):
             return False
     
     def find_unique_available_port(self, port_range, service_name):
         # Try to use the last assigned port from port_manager first
         last_port = port_manager.get_last_assigned_port(service_name)
-        if last_port and self.check_port_available(last_port):
+        if last_port in port_range and self._port_is_free(last_port):
             return last_port
         # Fallback to saved_ports (legacy)
         last_port_legacy = self.saved_ports.get(service_name)
-        if last_port_legacy and self.check_port_available(last_port_legacy):
+        if last_port_legacy in port_range and self._port_is_free(last_port_legacy):
             return last_port_legacy
         for port in port_range:
-            if self.check_port_available(port):
+            if self._port_is_free(port):
                 # Save assignment in port_manager
                 port_manager.save_port_assignment(service_name, port)
                 return port
-        raise RuntimeError(f"No available port found in range {port_range}")
+        # Clients look ports up in service_ports.json, so any free port will do
+        port = port_manager.find_ephemeral_port()
+        logger.log_warning(f"No available port in range {port_range} for {service_name}, using {port}")
+        port_manager.save_port_assignment(service_name, port)
+        return port
     
+    def _port_pid_map(self) -> dict:
+        """Snapshot the listening port -> pid table, reused for the whole startup sweep"""
+        now = time.monotonic()
+        if self._port_pids is None or now - self._port_pids_at > self.port_snapshot_ttl:
+            port_pids = {}
+            listening = set()
+            for conn in psutil.net_connections(kind='tcp'):
+                if not conn.laddr:
+                    continue
+                if conn.status == psutil.CONN_LISTEN:
+                    listening.add(conn.laddr.port)
+                if not conn.pid:
+                    continue
+                # A listening socket identifies the port owner; other sockets only fill gaps
+                if conn.status == psutil.CONN_LISTEN or conn.laddr.port not in port_pids:
+                    port_pids[conn.laddr.port] = conn.pid
+            self._port_pids = port_pids
+            self._listening_ports = listening
+            self._port_pids_at = now
+        return self._port_pids
+
+    def _port_is_free(self, port: int) -> bool:
+        """Check a candidate port against the cached LISTEN set instead of probing a socket"""
+        try:
+            self._port_pid_map()
+        except psutil.AccessDenied:
+            return self.check_port_available(port)
+        return port not in self._listening_ports
+
+    def _mark_port_listening(self, port: int):
+        self._port_cache.pop(port, None)
+        if self._port_pids is not None:
+            self._listening_ports.add(port)
+
     def kill_process_on_port(self, port: int) -> bool:
         """Kill any process using the specified port - Windows compatible"""
-        try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    # Windows-compatible way to get connections
-                    if hasattr(proc, 'connections'):
-                        connections = proc.connections()
-                        for conn in connections:
-                            if hasattr(conn, 'laddr') and hasattr(conn.laddr, 'port') and conn.laddr.port == port:
-                                logger.log_info(f"Killing process {proc.info['pid']} on port {port}")
-                                proc.terminate()
-                                proc.wait(timeout=5)
-                                return True
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired, AttributeError):
-                    continue
+        if self.check_port_available(port):
+            return False  # nothing is listening, no need to look up an owner
+        self._port_cache.pop(port, None)  # the owner is about to change
+        pid = self._find_port_owner_ss(port)
+        if pid is None:
+            try:
+                pid = self._port_pid_map().get(port)
+            except psutil.AccessDenied:
+                # Some platforms (macOS without root) refuse a system-wide connection table
+                return self._kill_process_on_port_scan(port)
+            except Exception as e:
+                logger.log_error(f"Error killing process on port {port}: {e}")
+                return False
+        if not pid:
             return False
-        except Exception as e:
-            logger.log_error(f"Error killing process on port {port}: {e}")
+        if self._port_pids is not None:
+            self._port_pids.pop(port, None)
+        try:
+            proc = psutil.Process(pid)
+            logger.log_info(f"Killing process {pid} on port {port}")
+            proc.terminate()
+            proc.wait(timeout=5)
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired) as e:
+            logger.log_error(f"Error killing process {pid} on port {port}: {e}")
             return False
+
+    @staticmethod
+    def _find_port_owner_ss(port: int) -> Optional[int]:
+        """Linux fast path: let the kernel filter sockets by port via `ss` instead of listing them all"""
+        ss_path = _which('ss') if sys.platform.startswith('linux') else None
+        if not ss_path:
+            return None
+        try:
+            result = subprocess.run([ss_path, '-Hltnp', f'sport = :{port}'],
+                                    capture_output=True, text=True, timeout=2)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        match = re.search(r'pid=(\d+)', result.stdout)
+        return int(match.group(1)) if match else None
+
+    def _kill_process_on_port_scan(self, port: int) -> bool:
+        """Per-process fallback used when the connection table is not readable"""
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                for conn in proc.connections():
+                    if conn.laddr and conn.laddr.port == port:
+                        logger.log_info(f"Killing process {proc.info['pid']} on port {port}")
+                        proc.terminate()
+                        proc.wait(timeout=5)
+                        return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired, AttributeError):
+                continue
+        return False
     
     def wait_for_service(self, url: str, timeout: int = 30) -> bool:
         """Wait for a service to be ready"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        parsed = urlsplit(url)
+        address = (parsed.hostname, parsed.port or 80)
+        # Prepared once; each poll just sends it again
+        probe = self._session.prepare_request(requests.Request('HEAD', url))
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            # A refused TCP connect is far cheaper than a failed HTTP request
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.settimeout(0.05)
+                listening = s.connect_ex(address) == 0
+            if not listening:
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+                continue
             try:
-                response = requests.get(url, timeout=2)
+                response = self._session.send(probe, timeout=0.5)
+                if response.status_code == 405:
+                    # FastAPI GET routes do not answer HEAD; use GET for the remaining polls
+                    probe = self._session.prepare_request(requests.Request('GET', url))
+                    response = self._session.send(probe, timeout=0.5)
                 if response.status_code == 200:
                     return True
             except requests.RequestException:
                 pass
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        return False
+
+    async def _wait_async(self, session: aiohttp.ClientSession, url: str, timeout: float) -> bool:
+        """Coroutine counterpart of wait_for_service, sharing one aiohttp session"""
+        probe_timeout = aiohttp.ClientTimeout(total=0.5)
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(url, timeout=probe_timeout) as response:
+                    if response.status == 200:
+                        return True
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
         return False
+
+    async def _wait_for_services(self, service_names: List[str]):
+        """Poll the /health endpoints of several services concurrently on one event loop"""
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=8)) as session:
+            for service_name in service_names:
+                info = self.services[service_name]
+                info['ready_future'] = asyncio.ensure_future(self._wait_async(
+                    session, f"http://localhost:{info['port']}/health", self.readiness_timeout
+                ))
+            await asyncio.gather(*(self.services[name]['ready_future'] for name in service_names))
     
     def check_node_installation(self) -> bool:
         """Check if Node.js and npm are installed"""
         try:
-            node_path = shutil.which('node')
-            npm_path = shutil.which('npm')
-            logger.log_info(f"PATH: {os.environ.get('PATH')}")
+            node_path = _which('node')
+            npm_path = _which('npm')
             logger.log_info(f"node path: {node_path}")
             logger.log_info(f"npm path: {npm_path}")
-            # Try node -v
-            node_ok = False
-            npm_ok = False
-            if node_path:
-                result = subprocess.run([node_path, '--version'], capture_output=True, text=True, timeout=10)
-                logger.log_info(f"node -v output: {result.stdout.strip()} (rc={result.returncode})")
-                node_ok = result.returncode == 0
-            if npm_path:
-                result = subprocess.run([npm_path, '--version'], capture_output=True, text=True, timeout=10)
-                logger.log_info(f"npm -v output: {result.stdout.strip()} (rc={result.returncode})")
-                npm_ok = result.returncode == 0
-            if node_ok and npm_ok:
-                logger.log_info("Node.js and npm are properly installed and available in PATH.")
+            if not node_path or not npm_path:
+                logger.log_error("Node.js or npm not found. Please install Node.js from https://nodejs.org/ or check your PATH and try opening a new terminal window.")
+                _log_path()
+                return False
+            # Skip the version probes if the same binaries already passed them
+            fingerprint = {
+                'node_path': node_path,
+                'npm_path': npm_path,
+                'node_mtime': os.stat(node_path).st_mtime,
+                'npm_mtime': os.stat(npm_path).st_mtime,
+            }
+            cache = self._load_startup_cache()
+            if (cache.get('node_ok') and cache.get('npm_ok')
+                    and all(cache.get(key) == value for key, value in fingerprint.items())):
+                logger.log_info(f"Node.js {cache.get('node_version')} / npm {cache.get('npm_version')} (cached check)")
                 return True
-            else:
-                logger.log_error("Node.js or npm not found or not working. Please check your PATH and try opening a new terminal window.")
-                logger.log_error(f"PATH: {os.environ.get('PATH')}")
+            # Try node -v / npm -v, both at once
+            probes = (('node', node_path), ('npm', npm_path))
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(
+                    lambda path: subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10),
+                    [path for _, path in probes]))
+            status = {}
+            for (name, _), result in zip(probes, results):
+                logger.log_info(f"{name} -v output: {result.stdout.strip()} (rc={result.returncode})")
+                status[f"{name}_ok"] = result.returncode == 0
+                status[f"{name}_version"] = result.stdout.strip()
+            if not (status['node_ok'] and status['npm_ok']):
+                logger.log_error("Node.js or npm not working. Please check your PATH and try opening a new terminal window.")
+                _log_path()
                 return False
+            logger.log_info("Node.js and npm are properly installed and available in PATH.")
+            self._save_startup_cache({**fingerprint, **status, 'checked_at': time.time()})
+            return True
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
             logger.log_error(f"Node.js or npm not found. Please install Node.js from https://nodejs.org/ or check your PATH. Error: {e}")
-            logger.log_error(f"PATH: {os.environ.get('PATH')}")
+            _log_path()
             return False
 
+    def _load_startup_cache(self) -> dict:
+        try:
+            with open(self.startup_cache_file, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_startup_cache(self, cache: dict):
+        try:
+            with open(self.startup_cache_file, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.log_warning(f"Could not write {self.startup_cache_file}: {e}")
+
+    def _package_lock_hash(self) -> Optional[str]:
+        try:
+            return hashlib.blake2b(Path('package-lock.json').read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            return None
+
     def install_npm_dependencies(self) -> bool:
-        """Install npm dependencies if node_modules doesn't exist"""
-        if not Path('node_modules').exists():
+        """Install npm dependencies if node_modules is missing or package-lock.json changed since the last install"""
+        lock_hash = self._package_lock_hash()
+        try:
+            stamp = self.npm_install_stamp.read_text().strip()
+        except OSError:
+            stamp = None
+        # Without a lockfile there is nothing to compare, so only a missing node_modules triggers an install
+        stale = lock_hash is not None and stamp is not None and stamp != lock_hash
+        if not Path('node_modules').exists() or stale:
             logger.log_info("Installing npm dependencies...")
             try:
                 result = subprocess.run(['npm', 'install'], capture_output=True, text=True, timeout=300)
                 if result.returncode == 0:
                     logger.log_info("Successfully installed npm dependencies")
+                    if lock_hash:
+                        self.npm_install_stamp.write_text(lock_hash)
                     return True
                 else:
                     logger.log_error(f"Failed to install npm dependencies: {result.stderr}")
@@ -164,6 +491,9 @@ class AutoStartup:
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 logger.log_error("Failed to run npm install")
                 return False
+        if lock_hash and stamp is None:
+            # Existing node_modules predates the stamp; adopt it as current
+            self.npm_install_stamp.write_text(lock_hash)
         return True
 
     def create_env_if_missing(self) -> bool:
@@ -187,43 +517,58 @@ class AutoStartup:
     def is_service_healthy(self, port, health_path="/health"):
         try:
             url = f"http://localhost:{port}{health_path}"
-            resp = requests.get(url, timeout=2)
-            if resp.status_code == 200 and (resp.json().get("status") == "ok" or resp.text == "ok"):
+            resp = self._session.get(url, timeout=2)
+            if resp.status_code != 200:
+                return False
+            if resp.content == b"ok":
                 return True
-        except Exception:
+            if resp.headers.get("content-type", "").startswith("application/json"):
+                return resp.json().get("status") == "ok"
+        except (requests.RequestException, ValueError, AttributeError):
             pass
         return False
 
     def start_python_service(self, script: str, service_name: str):
-        port_range = self.service_port_ranges[service_name]
-        port = self.find_unique_available_port(port_range, service_name)
-        # Save assignment in port_manager
-        port_manager.save_port_assignment(service_name, port)
-        self.services[service_name]['port'] = port
-        self.save_ports()
+        """Spawn a Python service without waiting for it to become ready"""
+        return self.spawn_python_service(script, service_name)
+
+    def reserve_port(self, service_name: str) -> int:
+        """Pick and record a port for a service; serialized so concurrent starts don't collide"""
+        with self._port_lock:
+            port = self.find_unique_available_port(self.SERVICE_PORT_RANGES[service_name], service_name)
+            # Save assignment in port_manager
+            port_manager.save_port_assignment(service_name, port)
+            self.services[service_name]['port'] = port
+            self._ports_dirty = True
+            return port
+
+    def spawn_python_service(self, script: str, service_name: str):
+        # Fast path for restarts: the service recorded in service_ports.json is still up
+        saved_port = self.saved_ports.get(service_name)
+        if saved_port and self.is_service_healthy(saved_port):
+            self.services[service_name]['port'] = saved_port
+            logger.log_info(f"{service_name} already running and healthy on saved port {saved_port}, reusing.")
+            return None  # Do not restart
+        port = self.reserve_port(service_name)
         # Health check before killing/restarting
         if self.is_service_healthy(port):
             logger.log_info(f"{service_name} already running and healthy on port {port}, reusing.")
             return None  # Do not restart
-        self.kill_process_on_port(port)
-        time.sleep(1)
+        if not self.check_port_available(port) and self.kill_process_on_port(port):
+            time.sleep(1)  # give the OS a moment to release the port
         logger.log_info(f"Starting {service_name} on port {port}...")
         try:
             process = subprocess.Popen(
                 [sys.executable, script, f"--port={port}"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
+                **SPAWN_OPTIONS
             )
             self.services[service_name]['process'] = process
+            self._mark_port_listening(port)
             # Log output in real time
-            def log_output(stream, log_func):
-                for line in iter(stream.readline, ''):
-                    log_func(f"[{service_name}] {line.strip()}")
-            threading.Thread(target=log_output, args=(process.stdout, logger.log_info), daemon=True).start()
-            threading.Thread(target=log_output, args=(process.stderr, logger.log_error), daemon=True).start()
+            self._log_pump.register(process.stdout, service_name, logger.log_info)
+            self._log_pump.register(process.stderr, service_name, logger.log_error)
             return process
         except Exception as e:
             logger.log_error(f"Error starting {service_name}: {e}")
@@ -231,17 +576,14 @@ class AutoStartup:
             return None
     
     def start_react_frontend(self):
-        port_range = self.service_port_ranges['react_frontend']
-        port = self.find_unique_available_port(port_range, 'react_frontend')
-        self.services['react_frontend']['port'] = port
-        self.save_ports()
+        port = self.reserve_port('react_frontend')
         # Health check before killing/restarting
         if self.is_service_healthy(port):
             logger.log_info(f"React frontend already running and healthy on port {port}, reusing.")
             self.open_browser(f"http://localhost:{port}")
             return None  # Do not restart
-        self.kill_process_on_port(port)
-        time.sleep(1)
+        if not self.check_port_available(port) and self.kill_process_on_port(port):
+            time.sleep(1)  # give the OS a moment to release the port
         logger.log_info(f"Starting React frontend on port {port}...")
         
         # Use the new start_auto script if available
@@ -249,14 +591,15 @@ class AutoStartup:
         if start_auto_script.exists():
             logger.log_info("Using start_auto script for React frontend...")
             try:
-                process = subprocess.Popen(
-                    [sys.executable, str(start_auto_script)],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+                with self._open_service_log('react_frontend') as log_file:
+                    process = subprocess.Popen(
+                        [sys.executable, str(start_auto_script)],
+                        stdout=log_file,
+                        stderr=subprocess.STDOUT,
+                        **SPAWN_OPTIONS
+                    )
                 self.services['react_frontend']['process'] = process
-                self.save_ports()
+                self._mark_port_listening(port)
                 self.open_browser(f"http://localhost:{port}")
                 return process
             except Exception as e:
@@ -270,23 +613,24 @@ class AutoStartup:
         if not package_json.exists():
             logger.log_error(f"No package.json found in {react_app_dir}")
             return None
-        npm_path = shutil.which('npm')
+        npm_path = _which('npm')
         if not npm_path:
             logger.log_error("Could not find 'npm' in PATH.")
             return None
         env = os.environ.copy()
         env['PORT'] = str(port)
         try:
-            process = subprocess.Popen(
-                [npm_path, 'start'],
-                cwd=str(react_app_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env
-            )
+            with self._open_service_log('react_frontend') as log_file:
+                process = subprocess.Popen(
+                    [npm_path, 'start'],
+                    cwd=str(react_app_dir),
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    env=env,
+                    **SPAWN_OPTIONS
+                )
             self.services['react_frontend']['process'] = process
-            self.save_ports()
+            self._mark_port_listening(port)
             self.open_browser(f"http://localhost:{port}")
             return process
         except Exception as e:
@@ -294,6 +638,26 @@ class AutoStartup:
             self.services['react_frontend']['process'] = None
             return None
     
+    @staticmethod
+    def _open_service_log(service_name: str):
+        """Unbuffered append-mode log file for a child's output; the child keeps its own copy of the fd"""
+        centralized_logging.LOGS_DIR.mkdir(exist_ok=True)
+        return open(centralized_logging.LOGS_DIR / f"{service_name}.log", 'ab', buffering=0)
+
+    def start_all_services(self) -> dict:
+        """Start every service concurrently; returns {service_name: process or None}"""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                service_name: executor.submit(self.spawn_python_service, script, service_name)
+                for script, service_name in self.python_services
+            }
+            futures['react_frontend'] = executor.submit(self.start_react_frontend)
+            results = {service_name: future.result() for service_name, future in futures.items()}
+        for service_name, process in results.items():
+            self.services[service_name]['process'] = process
+        self.flush_ports()
+        return results
+
     def open_browser(self, url: str):
         """Open browser with the application"""
         try:
@@ -306,17 +670,30 @@ class AutoStartup:
     def cleanup_on_exit(self):
         """Cleanup function to terminate all processes"""
         logger.log_info("Cleaning up processes...")
+        # Terminate everything first, then wait on all of them together
+        names = {}
         for service_name, service_info in self.services.items():
             if service_info['process'] and service_info['process'].poll() is None:
                 try:
-                    service_info['process'].terminate()
-                    service_info['process'].wait(timeout=5)
-                    logger.log_info(f"Terminated {service_name}")
-                except subprocess.TimeoutExpired:
-                    service_info['process'].kill()
-                    logger.log_info(f"Killed {service_name}")
+                    proc = psutil.Process(service_info['process'].pid)
+                    proc.terminate()
+                    names[proc] = service_name
+                except psutil.NoSuchProcess:
+                    continue
                 except Exception as e:
                     logger.log_error(f"Error terminating {service_name}: {e}")
+        gone, alive = psutil.wait_procs(list(names), timeout=5)
+        for proc in gone:
+            logger.log_info(f"Terminated {names[proc]}")
+        for proc in alive:
+            try:
+                proc.kill()
+                logger.log_info(f"Killed {names[proc]}")
+            except psutil.NoSuchProcess:
+                pass
+            except Exception as e:
+                logger.log_error(f"Error killing {names[proc]}: {e}")
+        self._session.close()
     
     def restart_api_bridge(self):
         """Gracefully restart the API bridge process"""
@@ -331,8 +708,10 @@ class AutoStartup:
                 proc.kill()
         # Start new process
         logger.log_info("[Auto] Restarting API bridge...")
-        new_proc = subprocess.Popen([sys.executable, svc['script']], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        new_proc = subprocess.Popen([sys.executable, svc['script']], stdout=subprocess.PIPE, stderr=subprocess.PIPE, **SPAWN_OPTIONS)
         svc['process'] = new_proc
+        self._log_pump.register(new_proc.stdout, 'api_bridge', logger.log_info)
+        self._log_pump.register(new_proc.stderr, 'api_bridge', logger.log_error)
         # Wait for service to be ready
         if self.wait_for_service(f"http://localhost:{svc['port']}/health", timeout=30):
             logger.log_info("[Auto] API bridge restarted successfully.")
@@ -347,6 +726,35 @@ class AutoStartup:
         else:
             logger.log_error("[Auto] ❌ Some resume upload tests failed.")
 
+    def _on_sigchld(self, signum, frame):
+        # Children are not reaped here: waitpid(-1) would steal the exit
+        # status from their Popen objects, which poll() below relies on
+        self._child_died.set()
+
+    def _dead_service(self) -> Optional[str]:
+        for service_name, service_info in self.services.items():
+            if service_info['process'] and service_info['process'].poll() is not None:
+                return service_name
+        return None
+
+    def wait_for_service_exit(self) -> str:
+        """Block until one of the started services exits and return its name"""
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, self._on_sigchld)
+        else:
+            # No SIGCHLD on Windows: one waiter per child blocks on the process handle instead
+            for service_info in self.services.values():
+                if service_info['process']:
+                    threading.Thread(target=lambda p=service_info['process']: (p.wait(), self._child_died.set()),
+                                     daemon=True).start()
+        while True:
+            # Also covers a child that exited before the handler was installed
+            service_name = self._dead_service()
+            if service_name:
+                return service_name
+            self._child_died.wait()
+            self._child_died.clear()
+
     def run(self):
         """Main startup sequence"""
         try:
@@ -367,28 +775,26 @@ class AutoStartup:
                 logger.log_error("Failed to create .env file")
                 return False
             
-            # Start services in order
+            # Start services
             services_started = []
             
-            # 1. Start API Bridge
-            self.services['api_bridge']['process'] = self.start_python_service('api_bridge_with_database.py', 'api_bridge')
-            if self.services['api_bridge']['process']:
-                services_started.append('api_bridge')
-            
-            # 2. Start MCP Backend
-            self.services['mcp_backend']['process'] = self.start_python_service('linkedin_browser_mcp.py', 'mcp_backend')
-            if self.services['mcp_backend']['process']:
-                services_started.append('mcp_backend')
-            
-            # 3. Start LLM Controller
-            self.services['llm_controller']['process'] = self.start_python_service('llm_controller.py', 'llm_controller')
-            if self.services['llm_controller']['process']:
-                services_started.append('llm_controller')
-            
-            # 4. Start React Frontend
-            self.services['react_frontend']['process'] = self.start_react_frontend()
+            # The services have no startup dependency on each other, so they are
+            # spawned together and the Python services' readiness is polled concurrently.
+            # The frontend counts as started once spawned: start_auto.py may move it to another port
+            self.start_all_services()
             if self.services['react_frontend']['process']:
                 services_started.append('react_frontend')
+            asyncio.run(self._wait_for_services(
+                [service_name for _, service_name in self.python_services if self.services[service_name]['process']]
+            ))
+            for _, service_name in self.python_services:
+                future = self.services[service_name]['ready_future']
+                if future is None:
+                    continue
+                if future.result():
+                    services_started.append(service_name)
+                else:
+                    logger.log_error(f"{service_name} did not become ready on port {self.services[service_name]['port']}")
             
             # Check if all services started
             if len(services_started) == len(self.services):
@@ -401,13 +807,9 @@ class AutoStartup:
                 
                 # Keep running until interrupted
                 try:
-                    while True:
-                        time.sleep(1)
-                        # Check if any service died
-                        for service_name, service_info in self.services.items():
-                            if service_info['process'] and service_info['process'].poll() is not None:
-                                logger.log_error(f"{service_name} has stopped unexpectedly")
-                                return False
+                    service_name = self.wait_for_service_exit()
+                    logger.log_error(f"{service_name} has stopped unexpectedly")
+                    return False
                 except KeyboardInterrupt:
                     logger.log_info("Received interrupt signal")
                     return True
@@ -422,24 +824,111 @@ class AutoStartup:
             self.cleanup_on_exit()
 
 # Backend file watcher
-class BackendChangeHandler(FileSystemEventHandler):
-    def __init__(self, restart_api_bridge, run_tests):
+BACKEND_SOURCE_DIRS = ('core', 'orchestrators', 'repositories', 'services', 'shared', 'legacy/database')
+
+class BackendChangeHandler(PatternMatchingEventHandler):
+    """Restarts the API bridge and reruns tests once a burst of .py saves goes quiet"""
+
+    watched_patterns = ['*.py']
+    ignored_patterns = ['*/__pycache__/*', '*/.venv/*', '*/node_modules/*', '*/.git/*', '*/build/*', '*/dist/*']
+
+    def __init__(self, restart_api_bridge, run_tests, debounce_seconds: float = 0.3):
+        super().__init__(patterns=self.watched_patterns, ignore_patterns=self.ignored_patterns,
+                         ignore_directories=True)
         self.restart_api_bridge = restart_api_bridge
         self.run_tests = run_tests
+        self.debounce_seconds = debounce_seconds
+        self._timer = None
+        self._lock = threading.Lock()
 
     def on_modified(self, event):
-        if event.is_directory:
-            return
-        path_str = str(event.src_path)
-        if path_str.endswith('.py'):
-            logger.log_info(f"[Auto] Detected change in {event.src_path}, restarting API bridge and running tests...")
-            self.restart_api_bridge()
-            self.run_tests()
+        self._schedule(event)
+
+    def on_created(self, event):
+        self._schedule(event)
+
+    def on_moved(self, event):
+        # Editors that save via tempfile + rename only produce a move onto the .py file
+        self._schedule(event)
+
+    def _schedule(self, event):
+        logger.log_info(f"[Auto] Detected change in {event.src_path}")
+        # Editors emit several events per save; restart the timer on each one
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _fire(self):
+        with self._lock:
+            self._timer = None
+        logger.log_info("[Auto] Changes settled, restarting API bridge and running tests...")
+        self.restart_api_bridge()
+        self.run_tests()
+
+def _inotify_watch_dirs() -> List[str]:
+    # inotify watches are not recursive, so every package subdirectory gets its own
+    ignored = {'__pycache__', '.venv', 'node_modules', '.git', 'build', 'dist'}
+    dirs = ['.']
+    for source_dir in BACKEND_SOURCE_DIRS:
+        for root, subdirs, _ in os.walk(source_dir):
+            subdirs[:] = [d for d in subdirs if d not in ignored]
+            dirs.append(root)
+    return dirs
+
+async def _watch_with_inotify(restart_api_bridge, run_tests, debounce_seconds: float = 0.3):
+    """inotify version of the watchdog observer: CLOSE_WRITE/MOVED_TO fire once per save"""
+    with Inotify() as inotify:
+        for directory in _inotify_watch_dirs():
+            inotify.add_watch(directory, Mask.CLOSE_WRITE | Mask.MOVED_TO)
+        logger.log_info("[Auto] Watching for backend code changes. Press Ctrl+C to stop.")
+        # One read is always outstanding; the debounce only waits on it, since
+        # cancelling an in-flight get() could lose the event it was reading
+        pending_get = None
+        try:
+            while True:
+                if pending_get is None:
+                    pending_get = asyncio.ensure_future(inotify.get())
+                event = await pending_get
+                pending_get = None
+                path_str = str(event.path)
+                if not any(fnmatch.fnmatch(path_str, p) for p in BackendChangeHandler.watched_patterns):
+                    continue
+                if any(fnmatch.fnmatch(path_str, p) for p in BackendChangeHandler.ignored_patterns):
+                    continue
+                logger.log_info(f"[Auto] Detected change in {path_str}")
+                # Swallow the rest of the burst before acting on it
+                while True:
+                    pending_get = asyncio.ensure_future(inotify.get())
+                    done, _ = await asyncio.wait({pending_get}, timeout=debounce_seconds)
+                    if not done:
+                        break
+                    pending_get.result()
+                    pending_get = None
+                logger.log_info("[Auto] Changes settled, restarting API bridge and running tests...")
+                await asyncio.to_thread(restart_api_bridge)
+                await asyncio.to_thread(run_tests)
+        finally:
+            if pending_get is not None:
+                pending_get.cancel()
 
 def watch_backend_and_test(restart_api_bridge, run_tests):
+    if INOTIFY_AVAILABLE:
+        try:
+            asyncio.run(_watch_with_inotify(restart_api_bridge, run_tests))
+        except KeyboardInterrupt:
+            pass
+        return
     event_handler = BackendChangeHandler(restart_api_bridge, run_tests)
     observer = Observer()
-    observer.schedule(event_handler, path='.', recursive=True)
+    # Top-level scripts only, plus the Python packages the backend imports;
+    # a recursive watch on '.' would also cover node_modules, .git, build output, ...
+    observer.schedule(event_handler, path='.', recursive=False)
+    for source_dir in BACKEND_SOURCE_DIRS:
+        if Path(source_dir).is_dir():
+            observer.schedule(event_handler, path=source_dir, recursive=True)
     observer.start()
     logger.log_info("[Auto] Watching for backend code changes. Press Ctrl+C to stop.")
     try:
@@ -452,15 +941,7 @@ def watch_backend_and_test(restart_api_bridge, run_tests):
 def main():
     """Main entry point"""
     startup = AutoStartup()
-    results = {}
-    # Start API Bridge
-    results['api_bridge'] = startup.start_python_service('api_bridge_with_database.py', 'api_bridge')
-    # Start MCP Backend
-    results['mcp_backend'] = startup.start_python_service('linkedin_browser_mcp.py', 'mcp_backend')
-    # Start LLM Controller
-    results['llm_controller'] = startup.start_python_service('llm_controller.py', 'llm_controller')
-    # Start React Frontend
-    results['react_frontend'] = startup.start_react_frontend()
+    results = startup.start_all_services()
     print("\nService startup summary:")
     for svc, proc in results.items():
         port = startup.services[svc]['port']
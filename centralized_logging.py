@@ -6,9 +6,14 @@ Provides unified logging across all services with error tracking and monitoring
 
 import os
 import sys
+import atexit
+import functools
 import json
+import itertools
+import locale
 import logging
 import logging.handlers
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -21,6 +26,196 @@ import time
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
 
+# Process id for service-start events, refreshed in forked children (e.g. uvicorn workers)
+_PID = os.getpid()
+
+def _refresh_pid():
+    global _PID
+    _PID = os.getpid()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+# Running QueueListener per logger name, so a rebuilt logger stops its predecessor's thread
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a queue that never leaves the process.
+    
+    The stdlib prepare() formats the message on the calling thread so the record can be
+    pickled; here the record is enqueued as-is and the listener thread does all formatting.
+    
+    When the listener thread is not running -- after it was stopped by close()/shutdown(),
+    or in a forked child, which does not inherit it -- records are written synchronously
+    to the unbuffered handlers instead of piling up in the queue.
+    """
+    
+    def __init__(self, queue, listener: logging.handlers.QueueListener,
+                 direct_handlers: List[logging.Handler]):
+        super().__init__(queue)
+        self.listener = listener
+        self.direct_handlers = direct_handlers
+    
+    def prepare(self, record):
+        return record
+    
+    def emit(self, record):
+        thread = self.listener._thread
+        if thread is not None and thread.is_alive():
+            super().emit(record)
+            return
+        # Handler.handle() already holds this handler's lock, so direct writes are serialized
+        for handler in self.direct_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+                handler.flush()
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that also flushes its buffered handlers at most flush_interval after a write"""
+    
+    flush_interval = 0.25
+    
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._dirty = False
+        self._flush_at = 0.0
+    
+    def dequeue(self, block):
+        while True:
+            # Only wake up on a timer while something is waiting in a buffer
+            timeout = max(0.0, self._flush_at - time.monotonic()) if self._dirty else None
+            try:
+                return self.queue.get(block, timeout)
+            except queue.Empty:
+                self.flush()
+    
+    def handle(self, record):
+        super().handle(record)
+        if not self._dirty:
+            self._dirty = True
+            self._flush_at = time.monotonic() + self.flush_interval
+        elif time.monotonic() >= self._flush_at:
+            self.flush()
+    
+    def flush(self):
+        for handler in self.handlers:
+            handler.flush()
+        self._dirty = False
+
+class _FastFormatter(logging.Formatter):
+    """Formatter that reuses the strftime() result for all records within the same second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+class _RotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler writing encoded records into a large append-only buffer, flushed per batch.
+    
+    The rollover check also skips its stat() calls and extra format() while far below maxBytes.
+    """
+    
+    # Larger than any realistic record, so the fast path can never let a file overshoot by much
+    rollover_headroom = 64 * 1024
+    write_buffer_size = 64 * 1024
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # FileHandler leaves the io.text_encoding() placeholder 'locale' when no
+        # encoding is given, which str.encode() does not understand
+        if self.encoding is None or self.encoding == 'locale':
+            self.encoding = locale.getpreferredencoding(False)
+    
+    def _open(self):
+        # Binary so that tell() doesn't force a flush the way TextIOWrapper.tell() does
+        return open(self.baseFilename, 'ab', buffering=self.write_buffer_size)
+    
+    def shouldRollover(self, record):
+        if self.stream is not None and self.stream.tell() + self.rollover_headroom < self.maxBytes:
+            return False
+        return super().shouldRollover(record)
+    
+    def emit(self, record):
+        # Unlike StreamHandler.emit there is no flush here; _BatchMemoryHandler flushes once per batch
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode(self.encoding, self.errors or 'strict'))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target's stream once after handing it a batch"""
+    
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target is not None:
+                self.target.flush()
+
+def _is_audit_record(record: logging.LogRecord) -> bool:
+    return getattr(record, 'audit', False)
+
+def _buffered(handler: logging.Handler) -> logging.handlers.MemoryHandler:
+    """Wrap a file handler so records reach it in batches; errors flush immediately"""
+    buffered = _BatchMemoryHandler(
+        capacity=512, flushLevel=logging.ERROR, target=handler, flushOnClose=True
+    )
+    # The target's level is not checked when the buffer is flushed, so filter up front
+    buffered.setLevel(handler.level)
+    for record_filter in handler.filters:
+        buffered.addFilter(record_filter)
+    return buffered
+
+def _monotonic_ns_to_iso(monotonic_ns: int) -> str:
+    """Wall-clock ISO timestamp for a time.monotonic_ns() reading"""
+    age = (time.monotonic_ns() - monotonic_ns) / 1e9
+    return datetime.fromtimestamp(time.time() - age).isoformat()
+
+@functools.lru_cache(maxsize=1)
+def _check_logs_dir_access(logs_dir: Path) -> bool:
+    if os.access(logs_dir, os.W_OK):
+        return True
+    print(f"[LOGGING WARNING] Log directory {logs_dir} is not writable; log rotation will fail!")
+    return False
+
+class _LazyJson:
+    """Serializes log context only if a handler actually formats the record"""
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+    
+    def __str__(self) -> str:
+        return json.dumps(self._data, default=str)
+
+def _stop_listener(listener: logging.handlers.QueueListener):
+    """Drain a listener's queue, stop its thread and close its handlers"""
+    if listener._thread is not None:
+        listener.stop()
+    for handler in listener.handlers:
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+
 class CentralizedLogger:
     """Centralized logging system for all services"""
     
@@ -37,25 +232,30 @@ class CentralizedLogger:
         self.logger = self._setup_logger()
         
         # Error tracking
+        # next() on itertools.count is atomic under the GIL, unlike `error_count += 1`
+        self._error_seq = itertools.count(1)
+        self._threshold_lock = threading.Lock()
         self.error_count = 0
-        self.last_error_time = None
+        self.last_error_time_ns = None  # time.monotonic_ns() of the latest error
         self.error_threshold = 10  # Alert after 10 errors in 5 minutes
         self.error_window = timedelta(minutes=5)
+        self._error_window_ns = int(self.error_window.total_seconds() * 1_000_000_000)
         
         # Performance tracking
-        self.performance_log = []
         self.max_performance_log_size = 1000
+        self.performance_log = deque(maxlen=self.max_performance_log_size)
+        # Running aggregates over performance_log; min/max are rescanned only after their entry is evicted
+        self._dur_sum = 0.0
+        self._dur_min = None
+        self._dur_max = None
+        self._dur_extremes_stale = False
         
-        # Add a utility function to check if log files are writable
-        if not self._check_log_file_access(self.log_file):
-            print(f"[LOGGING WARNING] Main log file {self.log_file} is not writable!")
-        if not self._check_log_file_access(self.error_file):
-            print(f"[LOGGING WARNING] Error log file {self.error_file} is not writable!")
-        if not self._check_log_file_access(self.audit_file):
-            print(f"[LOGGING WARNING] Audit log file {self.audit_file} is not writable!")
+        # The file handlers opened the log files for append above; rotation also
+        # needs to rename inside the directory, which is checked once per process
+        _check_logs_dir_access(LOGS_DIR)
         
     def _setup_logger(self) -> logging.Logger:
-        """Setup the logger with multiple handlers"""
+        """Setup the logger with multiple handlers, driven from a background QueueListener"""
         logger = logging.getLogger(f"linkedin_hunter.{self.service_name}")
         logger.setLevel(self.log_level)
         
@@ -65,117 +265,145 @@ class CentralizedLogger:
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(self.log_level)
-        console_formatter = logging.Formatter(
+        console_formatter = _FastFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
         
         # Main log file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _RotatingFileHandler(
             self.log_file,
             maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            encoding='utf-8'
         )
         file_handler.setLevel(self.log_level)
-        file_formatter = logging.Formatter(
+        file_formatter = _FastFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
         
         # Error log file handler
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = _RotatingFileHandler(
             self.error_file,
             maxBytes=5*1024*1024,  # 5MB
-            backupCount=3
+            backupCount=3,
+            encoding='utf-8'
         )
         error_handler.setLevel(logging.ERROR)
-        error_formatter = logging.Formatter(
+        error_formatter = _FastFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s\n---\n'
         )
         error_handler.setFormatter(error_formatter)
-        logger.addHandler(error_handler)
         
         # Audit log file handler
-        audit_handler = logging.handlers.RotatingFileHandler(
+        audit_handler = _RotatingFileHandler(
             self.audit_file,
             maxBytes=5*1024*1024,  # 5MB
-            backupCount=3
+            backupCount=3,
+            encoding='utf-8'
         )
         audit_handler.setLevel(logging.INFO)
-        audit_formatter = logging.Formatter(
+        audit_formatter = _FastFormatter(
             '%(asctime)s - %(name)s - AUDIT - %(message)s'
         )
         audit_handler.setFormatter(audit_formatter)
-        logger.addHandler(audit_handler)
+        # Only records from log_audit belong in the audit file
+        audit_handler.addFilter(_is_audit_record)
+        
+        # Callers only enqueue the record; formatting and file I/O happen on the
+        # listener thread, so threads don't serialize on the handlers' I/O locks
+        log_queue = queue.Queue(-1)
+        listener = _BatchingQueueListener(
+            log_queue, console_handler,
+            _buffered(file_handler), _buffered(error_handler), _buffered(audit_handler),
+            respect_handler_level=True
+        )
+        logger.addHandler(_InProcessQueueHandler(
+            log_queue, listener, [console_handler, file_handler, error_handler, audit_handler]
+        ))
+        with _listeners_lock:
+            previous = _listeners.pop(logger.name, None)
+            if previous is not None:
+                _stop_listener(previous)
+            listener.start()
+            _listeners[logger.name] = listener
         
         return logger
     
+    def close(self):
+        """Flush pending records and release this logger's handlers"""
+        with _listeners_lock:
+            listener = _listeners.pop(self.logger.name, None)
+        if listener is not None:
+            _stop_listener(listener)
+    
+    def _log(self, level: int, message: str, kwargs: Dict[str, Any], exc_info: bool = False):
+        # Context is passed as a lazy %-argument, so it is only serialized if the record is emitted;
+        # stacklevel=3 attributes funcName/lineno to whoever called log_*
+        if kwargs:
+            self.logger.log(level, "%s | Context: %s", message, _LazyJson(kwargs), exc_info=exc_info, stacklevel=3)
+        else:
+            self.logger.log(level, message, exc_info=exc_info, stacklevel=3)
+    
     def log_info(self, message: str, **kwargs):
         """Log info message with optional context"""
-        context = f" | Context: {json.dumps(kwargs)}" if kwargs else ""
-        self.logger.info(f"{message}{context}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, kwargs)
     
     def log_warning(self, message: str, **kwargs):
         """Log warning message with optional context"""
-        context = f" | Context: {json.dumps(kwargs)}" if kwargs else ""
-        self.logger.warning(f"{message}{context}")
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, kwargs)
     
     def log_error(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log error message with exception and context"""
-        self.error_count += 1
-        self.last_error_time = datetime.now()
+        self.error_count = next(self._error_seq)
+        self.last_error_time_ns = time.monotonic_ns()
         
-        context = f" | Context: {json.dumps(kwargs)}" if kwargs else ""
-        error_msg = f"{message}{context}"
-        
-        if exception:
-            self.logger.error(
-                error_msg,
-                exc_info=True
-            )
-        else:
-            self.logger.error(error_msg)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, kwargs, exc_info=bool(exception))
         
         # Check error threshold
         self._check_error_threshold()
     
     def log_critical(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log critical error message"""
-        context = f" | Context: {json.dumps(kwargs)}" if kwargs else ""
-        error_msg = f"CRITICAL: {message}{context}"
-        
-        if exception:
-            self.logger.critical(
-                error_msg,
-                exc_info=True
-            )
-        else:
-            self.logger.critical(error_msg)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, f"CRITICAL: {message}", kwargs, exc_info=bool(exception))
     
     def log_audit(self, action: str, user: str = "system", **kwargs):
         """Log audit events"""
-        audit_msg = f"Action: {action} | User: {user}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        # Lazy %-arguments: the message is only assembled when the audit handler formats it
         if kwargs:
-            audit_msg += f" | Details: {json.dumps(kwargs)}"
-        self.logger.info(audit_msg)
+            self.logger.info("Action: %s | User: %s | Details: %s", action, user, _LazyJson(kwargs),
+                             extra={'audit': True})
+        else:
+            self.logger.info("Action: %s | User: %s", action, user, extra={'audit': True})
     
     def log_performance(self, operation: str, duration: float, **kwargs):
         """Log performance metrics"""
         perf_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.monotonic_ns(),  # converted to ISO format in get_performance_summary
             'operation': operation,
             'duration': duration,
             'service': self.service_name,
             **kwargs
         }
         
+        # The deque drops the oldest entry itself once full
+        if len(self.performance_log) == self.performance_log.maxlen:
+            evicted = self.performance_log[0]['duration']
+            self._dur_sum -= evicted
+            if evicted == self._dur_min or evicted == self._dur_max:
+                self._dur_extremes_stale = True
         self.performance_log.append(perf_data)
-        
-        # Keep only recent entries
-        if len(self.performance_log) > self.max_performance_log_size:
-            self.performance_log = self.performance_log[-self.max_performance_log_size:]
+        self._dur_sum += duration
+        if not self._dur_extremes_stale:
+            self._dur_min = duration if self._dur_min is None else min(self._dur_min, duration)
+            self._dur_max = duration if self._dur_max is None else max(self._dur_max, duration)
         
         # Log if duration is significant
         if duration > 1.0:  # Log operations taking more than 1 second
@@ -185,24 +413,31 @@ class CentralizedLogger:
     
     def _check_error_threshold(self):
         """Check if error threshold has been exceeded"""
-        if self.last_error_time and self.error_count >= self.error_threshold:
-            time_diff = datetime.now() - self.last_error_time
-            if time_diff <= self.error_window:
+        if self.error_count < self.error_threshold:
+            return  # the common case: a single int comparison, no lock or clock read
+        with self._threshold_lock:
+            # Concurrent errors crossing the threshold together alert only once
+            if self.last_error_time_ns is None or self.error_count < self.error_threshold:
+                return
+            elapsed_ns = time.monotonic_ns() - self.last_error_time_ns
+            if elapsed_ns <= self._error_window_ns:
                 self.log_critical(
-                    f"Error threshold exceeded: {self.error_count} errors in {time_diff.total_seconds():.1f}s",
+                    f"Error threshold exceeded: {self.error_count} errors in {elapsed_ns / 1e9:.1f}s",
                     error_count=self.error_count,
                     error_window_seconds=self.error_window.total_seconds()
                 )
                 # Reset counter
+                self._error_seq = itertools.count(1)
                 self.error_count = 0
-                self.last_error_time = None
+                self.last_error_time_ns = None
     
     def get_error_summary(self) -> Dict[str, Any]:
         """Get summary of recent errors"""
         return {
             'service': self.service_name,
             'error_count': self.error_count,
-            'last_error_time': self.last_error_time.isoformat() if self.last_error_time else None,
+            'last_error_time': (_monotonic_ns_to_iso(self.last_error_time_ns)
+                                if self.last_error_time_ns is not None else None),
             'error_threshold': self.error_threshold,
             'error_window_seconds': self.error_window.total_seconds()
         }
@@ -212,42 +447,41 @@ class CentralizedLogger:
         if not self.performance_log:
             return {'service': self.service_name, 'operations': 0}
         
-        durations = [op['duration'] for op in self.performance_log]
+        if self._dur_extremes_stale:
+            durations = [op['duration'] for op in self.performance_log]
+            self._dur_min, self._dur_max = min(durations), max(durations)
+            self._dur_extremes_stale = False
         return {
             'service': self.service_name,
             'operations': len(self.performance_log),
-            'avg_duration': sum(durations) / len(durations),
-            'max_duration': max(durations),
-            'min_duration': min(durations),
-            'recent_operations': self.performance_log[-10:]  # Last 10 operations
+            'avg_duration': self._dur_sum / len(self.performance_log),
+            'max_duration': self._dur_max,
+            'min_duration': self._dur_min,
+            'recent_operations': [
+                {**op, 'timestamp': _monotonic_ns_to_iso(op['timestamp'])}
+                for op in itertools.islice(self.performance_log, max(0, len(self.performance_log) - 10), None)
+            ]  # Last 10 operations
         }
 
-    def _check_log_file_access(self, log_file):
-        try:
-            with open(log_file, 'a') as f:
-                f.write('')
-            return True
-        except Exception as e:
-            print(f"[LOGGING WARNING] Cannot write to log file {log_file}: {e}")
-            return False
-
 class LogManager:
     """Manages all loggers and provides centralized access"""
     
     def __init__(self):
         self.loggers: Dict[str, CentralizedLogger] = {}
-        self.log_queue = queue.Queue()
+        self._loggers_lock = threading.Lock()
+        # Records are written by each logger's QueueListener; the manager needs no thread of its own
         self.running = True
-        
-        # Start log processing thread
-        self.log_thread = threading.Thread(target=self._process_logs, daemon=True)
-        self.log_thread.start()
     
     def get_logger(self, service_name: str, log_level: str = "INFO") -> CentralizedLogger:
         """Get or create a logger for a service"""
-        if service_name not in self.loggers:
-            self.loggers[service_name] = CentralizedLogger(service_name, log_level)
-        return self.loggers[service_name]
+        logger = self.loggers.get(service_name)
+        if logger is None:
+            # Only creation takes the lock, so concurrent first calls can't build duplicate handlers
+            with self._loggers_lock:
+                logger = self.loggers.get(service_name)
+                if logger is None:
+                    logger = self.loggers[service_name] = CentralizedLogger(service_name, log_level)
+        return logger
     
     def log_system_event(self, event: str, **kwargs):
         """Log system-wide events"""
@@ -257,7 +491,7 @@ class LogManager:
     def log_service_start(self, service_name: str, port: Optional[int] = None):
         """Log service startup"""
         logger = self.get_logger(service_name)
-        logger.log_info(f"Service started", port=port, pid=os.getpid())
+        logger.log_info(f"Service started", port=port, pid=_PID)
         self.log_system_event("service_started", service=service_name, port=port)
     
     def log_service_stop(self, service_name: str):
@@ -315,28 +549,22 @@ class LogManager:
         
         return summaries
     
-    def _process_logs(self):
-        """Process logs in background thread"""
-        while self.running:
-            try:
-                # Process any queued logs
-                while not self.log_queue.empty():
-                    log_entry = self.log_queue.get_nowait()
-                    # Process log entry if needed
-                    pass
-                
-                time.sleep(1)
-            except Exception as e:
-                # Use basic logging for log processing errors
-                print(f"Log processing error: {e}")
-    
     def shutdown(self):
         """Shutdown the log manager"""
+        if not self.running:
+            return
         self.running = False
-        self.log_system_event("log_manager_shutdown")
+        # Only record the event on an existing system logger; shutdown also runs
+        # from atexit and must not build new handlers/listeners there
+        if "system" in self.loggers:
+            self.log_system_event("log_manager_shutdown")
+        for logger in list(self.loggers.values()):
+            logger.close()
 
 # Global log manager instance
 log_manager = LogManager()
+# Records still queued for the listener threads are written out at interpreter exit
+atexit.register(log_manager.shutdown)
 
 # Convenience functions
 def get_logger(service_name: str, log_level: str = "INFO") -> CentralizedLogger:
@@ -3,17 +3,39 @@ Centralized configuration management for the LinkedIn automation system.
 """
 import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _read_json(file_path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
+
+
+def _write_json(file_path: str, data: Any) -> None:
+    """Write indented JSON, using orjson's C serializer when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
 @dataclass
 class DatabaseConfig:
     """Database configuration"""
@@ -23,7 +45,7 @@ class DatabaseConfig:
     cleanup_days: int = 30
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LinkedInCredentialsConfig:
     """LinkedIn credentials configuration"""
     username: str = ""
@@ -53,7 +75,7 @@ class AutomationSettings:
     retry_delay_seconds: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """API server configuration"""
     host: str = "0.0.0.0"
@@ -84,17 +106,22 @@ class ServicePorts:
     
     @classmethod
     def load_from_file(cls, file_path: str = "service_ports.json") -> 'ServicePorts':
-        """Load service ports from file"""
+        """Load service ports from file, reusing the last parse while the file is unchanged"""
+        global _ports_cache
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            return cls(
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            if _ports_cache and _ports_cache[:2] == (file_path, mtime_ns):
+                return replace(_ports_cache[2])
+            data = _read_json(file_path)
+            ports = cls(
                 api_bridge=data.get('api_bridge', 8001),
                 job_management_api=data.get('job_management_api', 8003),
                 frontend=data.get('frontend_port', 3000),
                 mcp_backend=data.get('mcp_backend', 8101),
                 llm_controller=data.get('llm_controller', 8201)
             )
+            _ports_cache = (file_path, mtime_ns, ports)
+            return replace(ports)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logging.warning(f"Could not load service ports from {file_path}: {e}")
             return cls()
@@ -110,11 +137,14 @@ class ServicePorts:
             'llm_controller': self.llm_controller,
             'started_at': str(datetime.now())
         }
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(file_path, data)
 
 
-@dataclass
+# (file_path, st_mtime_ns, parsed ports) of the last ServicePorts.load_from_file
+_ports_cache: Optional[Tuple[str, int, ServicePorts]] = None
+
+
+@dataclass(frozen=True, slots=True)
 class RedisConfig:
     """Redis configuration"""
     host: str = os.getenv('REDIS_HOST', 'localhost')
@@ -169,8 +199,7 @@ class AutomationConfig:
         # Load from file if provided
         if config_file and os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
+                data = _read_json(config_file)
                 config = cls._from_dict(data)
             except Exception as e:
                 logging.warning(f"Could not load config from {config_file}: {e}")
@@ -197,9 +226,9 @@ class AutomationConfig:
         
         # API
         if api_host := os.getenv('API_HOST'):
-            self.api.host = api_host
+            self.api = replace(self.api, host=api_host)
         if api_port := os.getenv('API_PORT'):
-            self.api.port = int(api_port)
+            self.api = replace(self.api, port=int(api_port))
             
         # Environment
         self.environment = os.getenv('ENVIRONMENT', 'development')
@@ -286,8 +315,7 @@ class AutomationConfig:
             'debug': self.debug
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(config_file, data)
     
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors"""
@@ -326,6 +354,7 @@ def get_config() -> AutomationConfig:
 
 def reload_config(config_file: Optional[str] = None) -> AutomationConfig:
     """Reload configuration from file"""
-    global _config
+    global _config, _ports_cache
+    _ports_cache = None
     _config = AutomationConfig.load(config_file)
     return _config 
\ No newline at end of file
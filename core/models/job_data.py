@@ -25,7 +25,7 @@ class ApplicationStatus(Enum):
     WITHDRAWN = "withdrawn"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobData:
     """Structured job data model"""
     job_id: str
@@ -73,44 +73,72 @@ class JobData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JobData':
         """Create from dictionary"""
+        _get = data.get
+        
         # Handle datetime fields
-        scraped_at = data.get('scraped_at')
+        scraped_at = _get('scraped_at')
         if isinstance(scraped_at, str):
             scraped_at = datetime.fromisoformat(scraped_at)
         elif scraped_at is None:
             scraped_at = datetime.now()
             
-        posted_date = data.get('posted_date')
+        posted_date = _get('posted_date')
         if isinstance(posted_date, str):
             posted_date = datetime.fromisoformat(posted_date)
             
         # Handle status enum
-        status = data.get('status', JobStatus.SCRAPED.value)
+        status = _get('status', JobStatus.SCRAPED.value)
         if isinstance(status, str):
-            status = JobStatus(status)
-            
+            status = parse_job_status(status)
+        
+        # Slotted instances have no __dict__ to fill; positional arguments (in field
+        # order) still skip __init__'s keyword matching
         return cls(
-            job_id=data['job_id'],
-            title=data['title'],
-            company=data['company'],
-            location=data['location'],
-            job_url=data['job_url'],
-            description=data.get('description', ''),
-            salary_range=data.get('salary_range'),
-            job_type=data.get('job_type'),
-            experience_level=data.get('experience_level'),
-            easy_apply=data.get('easy_apply', False),
-            remote_work=data.get('remote_work', False),
-            posted_date=posted_date,
-            scraped_at=scraped_at,
-            status=status,
-            source=data.get('source', 'linkedin'),
-            tags=data.get('tags', []),
-            notes=data.get('notes', '')
+            data['job_id'],
+            data['title'],
+            data['company'],
+            data['location'],
+            data['job_url'],
+            _get('description', ''),
+            _get('salary_range'),
+            _get('job_type'),
+            _get('experience_level'),
+            _get('easy_apply', False),
+            _get('remote_work', False),
+            posted_date,
+            scraped_at,
+            status,
+            _get('source', 'linkedin'),
+            _get('tags', []),
+            _get('notes', '')
         )
+    
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> List['JobData']:
+        """Create many from dictionaries, parsing each distinct timestamp once"""
+        # Jobs scraped in one batch share most of their timestamps, so parsed
+        # values are memoised per call; missing ones share a single now()
+        parsed: Dict[str, datetime] = {}
+        now = None
+        jobs = []
+        for data in rows:
+            data = dict(data)
+            for key in ('scraped_at', 'posted_date'):
+                value = data.get(key)
+                if isinstance(value, str):
+                    dt = parsed.get(value)
+                    if dt is None:
+                        dt = parsed[value] = datetime.fromisoformat(value)
+                    data[key] = dt
+            if data.get('scraped_at') is None:
+                if now is None:
+                    now = datetime.now()
+                data['scraped_at'] = now
+            jobs.append(cls.from_dict(data))
+        return jobs
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchCriteria:
     """Job search criteria"""
     query: str
@@ -134,7 +162,7 @@ class SearchCriteria:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationResult:
     """Result of a job application attempt"""
     job_id: str
@@ -151,4 +179,13 @@ class ApplicationResult:
             'message': self.message,
             'error_details': self.error_details,
             'applied_at': self.applied_at.isoformat()
-        } 
\ No newline at end of file
+        } 
+
+
+# Plain dict lookups instead of Enum.__call__ when decoding stored status values
+_STATUS_BY_VALUE = {m.value: m for m in JobStatus}
+
+
+def parse_job_status(value: str) -> JobStatus:
+    """JobStatus for a stored value; unknown values still raise ValueError"""
+    return _STATUS_BY_VALUE.get(value) or JobStatus(value)
@@ -5,30 +5,41 @@ Create .env file with proper structure for LinkedIn Job Hunter
 
 import os
 
-def create_env_file():
-    """Create .env file with basic structure"""
-    env_content = """# LinkedIn Credentials
-LINKEDIN_USERNAME=your_email@example.com
-LINKEDIN_PASSWORD=your_password
-
-# Gemini API Key (for AI features)
-GEMINI_API_KEY=your_gemini_api_key
+# Sections of the generated .env file: (comment, [(key, placeholder), ...])
+ENV_SCHEMA = [
+    ("LinkedIn Credentials", [
+        ("LINKEDIN_USERNAME", "your_email@example.com"),
+        ("LINKEDIN_PASSWORD", "your_password"),
+    ]),
+    ("Gemini API Key (for AI features)", [("GEMINI_API_KEY", "your_gemini_api_key")]),
+    ("OpenAI API Key (for LLM features)", [("OPENAI_API_KEY", "your_openai_api_key")]),
+    ("Cookie Encryption Key (auto-generated)", [("COOKIE_ENCRYPTION_KEY", "")]),
+    ("Other Configuration", [
+        ("DEBUG", "true"),
+        ("HEADLESS", "true"),
+        ("TIMEOUT", "30000"),
+    ]),
+]
 
-# OpenAI API Key (for LLM features)
-OPENAI_API_KEY=your_openai_api_key
+def render_env(schema=ENV_SCHEMA) -> str:
+    """Render an env schema as .env file text"""
+    return "\n".join(
+        f"# {title}\n" + "".join(f"{key}={value}\n" for key, value in keys)
+        for title, keys in schema
+    )
 
-# Cookie Encryption Key (auto-generated)
-COOKIE_ENCRYPTION_KEY=
+# Rendered once at import. The file holds credentials, so it is created
+# owner-only (0o600)
+ENV_TEMPLATE = render_env().encode('utf-8')
 
-# Other Configuration
-DEBUG=true
-HEADLESS=true
-TIMEOUT=30000
-"""
-    
+def create_env_file():
+    """Create .env file with basic structure"""
     try:
-        with open('.env', 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        fd = os.open('.env', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, ENV_TEMPLATE)
+        finally:
+            os.close(fd)
         print("[SUCCESS] .env file created successfully!")
         print("[INFO] Please update your LinkedIn credentials in the .env file or use the web interface.")
         return True
@@ -17,7 +17,6 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'legacy
 
 try:
     from database.database import DatabaseManager
-    from database.migrations import run_migrations, migrate_saved_jobs_from_json, create_backup_before_migration, validate_migration
     DATABASE_AVAILABLE = True
 except ImportError as e:
     print(f"Database modules not available: {e}")
@@ -37,6 +36,14 @@ def initialize_database(db_path: str = "linkedin_jobs.db") -> DatabaseManager:
         logger.warning("Database modules not available, skipping database initialization")
         return None
         
+    try:
+        # Only initialization needs the migration helpers, so importers of this
+        # module don't pay for loading them
+        from database.migrations import run_migrations, migrate_saved_jobs_from_json, create_backup_before_migration, validate_migration
+    except ImportError as e:
+        logger.error("❌ Database migrations not available: %s", e)
+        return None
+        
     try:
         logger.info("🚀 Initializing LinkedIn Job Hunter Database")
         logger.info("=" * 50)
@@ -75,7 +82,7 @@ def initialize_database(db_path: str = "linkedin_jobs.db") -> DatabaseManager:
         return db_manager
         
     except Exception as e:
-        logger.error(f"❌ Database initialization failed: {e}")
+        logger.error("❌ Database initialization failed: %s", e)
         return None
 
 def test_database_functionality(db_manager: DatabaseManager):
@@ -96,7 +103,7 @@ def test_database_functionality(db_manager: DatabaseManager):
         )
         
         if user_id:
-            logger.info(f"✅ Created user with ID: {user_id}")
+            logger.info("✅ Created user with ID: %s", user_id)
             
             # Test job saving
             logger.info("Testing job saving...")
@@ -114,7 +121,7 @@ def test_database_functionality(db_manager: DatabaseManager):
             
             saved_job = db_manager.save_job(user_id, job_data)
             if saved_job:
-                logger.info(f"✅ Saved job: {saved_job.get('title')}")
+                logger.info("✅ Saved job: %s", saved_job.get('title'))
             
             # Test session creation
             logger.info("Testing session creation...")
@@ -125,7 +132,7 @@ def test_database_functionality(db_manager: DatabaseManager):
             )
             
             if session:
-                logger.info(f"✅ Created session: {session.get('session_id')}")
+                logger.info("✅ Created session: %s", session.get('session_id'))
                 
                 # Update session
                 db_manager.update_session(
@@ -158,41 +165,45 @@ def test_database_functionality(db_manager: DatabaseManager):
             if setting_value == "test_value":
                 logger.info("✅ System settings working")
             
-            # Get database stats
-            stats = db_manager.get_database_stats()
-            logger.info(f"📊 Database stats: {stats}")
+            # Get database stats (a query run only to be logged)
+            if logger.isEnabledFor(logging.INFO):
+                stats = db_manager.get_database_stats()
+                logger.info("📊 Database stats: %s", stats)
             
         else:
             logger.error("❌ Failed to create test user")
             
     except Exception as e:
-        logger.error(f"❌ Database functionality test failed: {e}")
+        logger.error("❌ Database functionality test failed: %s", e)
 
 def show_database_info(db_manager: DatabaseManager):
     """Show database information"""
+    # Everything below is queried only to be logged
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
         logger.info("\n📊 Database Information")
         logger.info("=" * 25)
         
         # Database stats
         stats = db_manager.get_database_stats()
-        logger.info(f"Users: {stats.get('users', 0)}")
-        logger.info(f"Saved Jobs: {stats.get('saved_jobs', 0)}")
-        logger.info(f"Applied Jobs: {stats.get('applied_jobs', 0)}")
-        logger.info(f"Sessions: {stats.get('sessions', 0)}")
-        logger.info(f"Automation Logs: {stats.get('automation_logs', 0)}")
-        logger.info(f"System Settings: {stats.get('settings', 0)}")
+        logger.info("Users: %s", stats.get('users', 0))
+        logger.info("Saved Jobs: %s", stats.get('saved_jobs', 0))
+        logger.info("Applied Jobs: %s", stats.get('applied_jobs', 0))
+        logger.info("Sessions: %s", stats.get('sessions', 0))
+        logger.info("Automation Logs: %s", stats.get('automation_logs', 0))
+        logger.info("System Settings: %s", stats.get('settings', 0))
         
         # Migration version
         migration_version = db_manager.get_setting('migration_version')
-        logger.info(f"Migration Version: {migration_version}")
+        logger.info("Migration Version: %s", migration_version)
         
         # System version
         system_version = db_manager.get_setting('system_version')
-        logger.info(f"System Version: {system_version}")
+        logger.info("System Version: %s", system_version)
         
     except Exception as e:
-        logger.error(f"❌ Failed to get database info: {e}")
+        logger.error("❌ Failed to get database info: %s", e)
 
 def cleanup_test_data(db_manager: DatabaseManager):
     """Clean up test data"""
@@ -204,7 +215,7 @@ def cleanup_test_data(db_manager: DatabaseManager):
         logger.info("✅ Test data cleanup completed")
         
     except Exception as e:
-        logger.error(f"❌ Test data cleanup failed: {e}")
+        logger.error("❌ Test data cleanup failed: %s", e)
 
 def main():
     """Main function"""
@@ -236,7 +247,7 @@ def main():
         return True
         
     except Exception as e:
-        logger.error(f"❌ Database integration failed: {e}")
+        logger.error("❌ Database integration failed: %s", e)
         return False
 
 if __name__ == "__main__":
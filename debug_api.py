@@ -7,39 +7,41 @@ import aiohttp
 import json
 import sys
 
-async def test_health_endpoint():
+# The health probe should fail fast; everything else uses the session's 10s
+HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+async def test_health_endpoint(session: aiohttp.ClientSession):
     """Test the health endpoint"""
     url = "http://localhost:8002/api/health"
     print(f"Testing health endpoint: {url}")
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=5) as response:
-                print(f"Status: {response.status}")
+        async with session.get(url, timeout=HEALTH_TIMEOUT) as response:
+            print(f"Health status: {response.status}")
+            
+            if response.status == 200:
+                result = await response.json()
+                print(f"Health response: {json.dumps(result, indent=2)}")
                 
-                if response.status == 200:
-                    result = await response.json()
-                    print(f"Response: {json.dumps(result, indent=2)}")
-                    
-                    if result.get("status") == "ok":
-                        print("✅ Health check PASSED")
-                        return True
-                    else:
-                        print("❌ Health check FAILED - wrong status")
-                        return False
+                if result.get("status") == "ok":
+                    print("✅ Health check PASSED")
+                    return True
                 else:
-                    text = await response.text()
-                    print(f"❌ Health check FAILED - status {response.status}: {text}")
+                    print("❌ Health check FAILED - wrong status")
                     return False
-                    
+            else:
+                text = await response.text()
+                print(f"❌ Health check FAILED - status {response.status}: {text}")
+                return False
+                
     except Exception as e:
         print(f"❌ Health check FAILED - exception: {e}")
         return False
 
-async def test_search_endpoint():
+async def test_search_endpoint(session: aiohttp.ClientSession):
     """Test the search endpoint with minimal payload"""
     url = "http://localhost:8002/api/search_jobs_internal"
-    print(f"\nTesting search endpoint: {url}")
+    print(f"Testing search endpoint: {url}")
     
     payload = {
         "query": "test",
@@ -48,20 +50,19 @@ async def test_search_endpoint():
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, timeout=10) as response:
-                print(f"Status: {response.status}")
+        async with session.post(url, json=payload) as response:
+            print(f"Search status: {response.status}")
+            
+            if response.status == 200:
+                result = await response.json()
+                print("✅ Search endpoint ACCESSIBLE")
+                print(f"Search response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+                return True
+            else:
+                text = await response.text()
+                print(f"❌ Search endpoint FAILED - status {response.status}: {text}")
+                return False
                 
-                if response.status == 200:
-                    result = await response.json()
-                    print("✅ Search endpoint ACCESSIBLE")
-                    print(f"Response keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
-                    return True
-                else:
-                    text = await response.text()
-                    print(f"❌ Search endpoint FAILED - status {response.status}: {text}")
-                    return False
-                    
     except Exception as e:
         print(f"❌ Search endpoint FAILED - exception: {e}")
         return False
@@ -93,11 +94,12 @@ async def main():
     print("🔧 API Debug Session")
     print("=" * 50)
     
-    # Test 1: Health endpoint
-    health_ok = await test_health_endpoint()
-    
-    # Test 2: Search endpoint
-    search_ok = await test_search_endpoint()
+    # Tests 1 and 2: health and search endpoints, concurrently over one session
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        health_ok, search_ok = await asyncio.gather(
+            test_health_endpoint(session),
+            test_search_endpoint(session)
+        )
     
     # Test 3: Refactored system
     refactored_ok = await test_refactored_system()
@@ -3,6 +3,7 @@
 Debug script for Node.js test issue
 """
 
+import shutil
 import subprocess
 import sys
 import os
@@ -11,15 +12,19 @@ def test_node_detection():
     """Test Node.js detection"""
     print("Testing Node.js detection...")
     
-    # Test 1: Direct command
-    print("\n1. Testing direct command:")
+    # Test 1: Resolve node on PATH once, then run that binary directly
+    print("\n1. Locating and running node:")
     try:
-        result = subprocess.run(["node", "--version"], 
-                              capture_output=True, text=True, timeout=10)
-        print(f"   Return code: {result.returncode}")
-        print(f"   Output: {result.stdout.strip()}")
-        print(f"   Error: {result.stderr.strip()}")
-        print(f"   Success: {result.returncode == 0}")
+        node_path = shutil.which("node")
+        print(f"   Node path: {node_path}")
+        print(f"   Node found: {node_path is not None}")
+        if node_path is not None:
+            result = subprocess.run([node_path, "--version"], 
+                                  capture_output=True, text=True, timeout=10)
+            print(f"   Return code: {result.returncode}")
+            print(f"   Output: {result.stdout.strip()}")
+            print(f"   Error: {result.stderr.strip()}")
+            print(f"   Success: {result.returncode == 0}")
     except Exception as e:
         print(f"   Exception: {e}")
     
@@ -39,16 +44,6 @@ def test_node_detection():
         print(f"   Success: {result.returncode == 0}")
     except Exception as e:
         print(f"   Exception: {e}")
-    
-    # Test 4: Check if node is in PATH
-    print("\n4. Checking if node is executable:")
-    try:
-        import shutil
-        node_path = shutil.which("node")
-        print(f"   Node path: {node_path}")
-        print(f"   Node found: {node_path is not None}")
-    except Exception as e:
-        print(f"   Exception: {e}")
 
 if __name__ == "__main__":
     test_node_detection() 
\ No newline at end of file
@@ -5,15 +5,76 @@ Addresses deployment and environment management gaps
 """
 
 import os
+import copy
 import json
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Built once; _load_config hands out deep copies
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "services": {
+        "api_bridge": {
+            "port": 8001,
+            "host": "localhost",
+            "workers": 1,
+            "timeout": 30
+        },
+        "mcp_backend": {
+            "port": 8002,
+            "host": "localhost",
+            "workers": 1,
+            "timeout": 30
+        },
+        "llm_controller": {
+            "port": 8003,
+            "host": "localhost",
+            "workers": 1,
+            "timeout": 30
+        },
+        "frontend": {
+            "port": 3000,
+            "host": "localhost",
+            "build_command": "npm run build",
+            "start_command": "npm start"
+        }
+    },
+    "database": {
+        "type": "sqlite",
+        "path": "linkedin_jobs.db",
+        "backup_enabled": True,
+        "backup_interval": 3600  # 1 hour
+    },
+    "security": {
+        "jwt_secret": None,  # resolved from JWT_SECRET_KEY per load
+        "cors_origins": ["http://localhost:3000"],
+        "rate_limit_enabled": True,
+        "ssl_enabled": False
+    },
+    "monitoring": {
+        "logging_level": "INFO",
+        "log_file": "app.log",
+        "metrics_enabled": True,
+        "health_check_interval": 60
+    },
+    "backup": {
+        "enabled": True,
+        "schedule": "0 */6 * * *",  # Every 6 hours
+        "retention_days": 7,
+        "backup_path": "backups/"
+    }
+}
+
+# Parsed config files keyed by (path, mtime_ns), so repeated DeploymentConfig
+# construction only stats the file
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
 class DeploymentConfig:
     """Deployment configuration manager"""
     
@@ -26,79 +87,44 @@ class DeploymentConfig:
         """Load deployment configuration"""
         config_file = f"deployment_config_{self.environment}.json"
         
-        if Path(config_file).exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        if mtime_ns is not None:
+            key = (config_file, mtime_ns)
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
+                with open(config_file, 'r') as f:
+                    config = _CONFIG_CACHE[key] = json.load(f)
+            return copy.deepcopy(config)
         
         # Default configuration
-        return {
-            "environment": self.environment,
-            "services": {
-                "api_bridge": {
-                    "port": 8001,
-                    "host": "localhost",
-                    "workers": 1,
-                    "timeout": 30
-                },
-                "mcp_backend": {
-                    "port": 8002,
-                    "host": "localhost",
-                    "workers": 1,
-                    "timeout": 30
-                },
-                "llm_controller": {
-                    "port": 8003,
-                    "host": "localhost",
-                    "workers": 1,
-                    "timeout": 30
-                },
-                "frontend": {
-                    "port": 3000,
-                    "host": "localhost",
-                    "build_command": "npm run build",
-                    "start_command": "npm start"
-                }
-            },
-            "database": {
-                "type": "sqlite",
-                "path": "linkedin_jobs.db",
-                "backup_enabled": True,
-                "backup_interval": 3600  # 1 hour
-            },
-            "security": {
-                "jwt_secret": os.getenv("JWT_SECRET_KEY", "change-in-production"),
-                "cors_origins": ["http://localhost:3000"],
-                "rate_limit_enabled": True,
-                "ssl_enabled": False
-            },
-            "monitoring": {
-                "logging_level": "INFO",
-                "log_file": "app.log",
-                "metrics_enabled": True,
-                "health_check_interval": 60
-            },
-            "backup": {
-                "enabled": True,
-                "schedule": "0 */6 * * *",  # Every 6 hours
-                "retention_days": 7,
-                "backup_path": "backups/"
-            }
-        }
+        config = copy.deepcopy(_DEFAULT_CONFIG)
+        config["environment"] = self.environment
+        config["security"]["jwt_secret"] = os.getenv("JWT_SECRET_KEY", "change-in-production")
+        return config
     
     def validate_environment(self) -> bool:
         """Validate deployment environment"""
         logger.info(f"Validating environment: {self.environment}")
         
         checks = [
-            self._check_python_version(),
-            self._check_dependencies(),
-            self._check_node_installation(),
-            self._check_database_connection(),
-            self._check_ports_availability(),
-            self._check_file_permissions()
+            self._check_python_version,
+            self._check_dependencies,
+            self._check_node_installation,
+            self._check_database_connection,
+            self._check_ports_availability,
+            self._check_file_permissions
         ]
         
-        all_passed = all(checks)
+        # The checks are independent and mostly wait on subprocesses, sockets or
+        # imports, so run them side by side; each one catches its own errors
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(lambda check: check(), checks))
+        
+        all_passed = all(results)
         logger.info(f"Environment validation: {'✅ PASSED' if all_passed else '❌ FAILED'}")
         return all_passed
     
@@ -132,7 +158,16 @@ class DeploymentConfig:
     def _check_node_installation(self) -> bool:
         """Check Node.js installation"""
         try:
-            result = subprocess.run(["node", "--version"], 
+            node_path = shutil.which("node")
+            if node_path is None:
+                logger.error("Node.js not found")
+                return False
+            
+            # Finding the binary is enough; only spawn it when the version is logged
+            if not logger.isEnabledFor(logging.INFO):
+                return True
+            
+            result = subprocess.run([node_path, "--version"], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 logger.info(f"Node.js version: {result.stdout.strip()}")
@@ -159,22 +194,54 @@ class DeploymentConfig:
     def _check_ports_availability(self) -> bool:
         """Check if required ports are available"""
         try:
+            import errno
+            import selectors
             import socket
+            import time
+            
+            ports = [service_config["port"] for service_config in self.config["services"].values()
+                     if "port" in service_config]
+            host = socket.gethostbyname('localhost')
             
-            for service_name, service_config in self.config["services"].items():
-                if "port" in service_config:
-                    port = service_config["port"]
+            # Start every connect without blocking and collect the outcomes in one
+            # selector pass, rather than waiting on each handshake in turn
+            in_use = {}
+            with selectors.DefaultSelector() as selector:
+                for port in ports:
                     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    result = sock.connect_ex(('localhost', port))
-                    sock.close()
-                    
-                    if result == 0:
-                        logger.warning(f"Port {port} is already in use")
-                        return False
+                    sock.setblocking(False)
+                    result = sock.connect_ex((host, port))
+                    if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, port)
                     else:
-                        logger.info(f"Port {port} is available")
+                        in_use[port] = result == 0
+                        sock.close()
+                
+                deadline = time.monotonic() + 0.2
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(timeout=remaining):
+                        sock = key.fileobj
+                        in_use[key.data] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                        selector.unregister(sock)
+                        sock.close()
+                
+                # No answer within the deadline means nothing is listening
+                for key in list(selector.get_map().values()):
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
             
-            return True
+            all_available = True
+            for port in ports:
+                if in_use.get(port):
+                    logger.warning(f"Port {port} is already in use")
+                    all_available = False
+                else:
+                    logger.info(f"Port {port} is available")
+            
+            return all_available
         except Exception as e:
             logger.error(f"Error checking ports: {e}")
             return False
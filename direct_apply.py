@@ -13,6 +13,7 @@ async def find_and_apply():
     """
     client = Client(str(Path(__file__).parent / "linkedin_browser_mcp.py"))
     applied_count = 0
+    in_flight = 0
     max_applications = 3
 
     async with client:
@@ -41,15 +42,13 @@ async def find_and_apply():
         jobs = search_data.get("jobs", [])
         logger.info(f"Found {len(jobs)} jobs.")
 
-        # 3. Apply to jobs
-        for job in jobs:
-            if applied_count >= max_applications:
-                break
-
-            job_url = job.get("jobUrl")
-            if not job_url:
-                continue
+        # 3. Apply to jobs, several at once over the shared client. A new attempt
+        # only starts while applied + in-flight is below the cap, so a burst of
+        # successes can never push past max_applications
+        pending = iter([job for job in jobs if job.get("jobUrl")])
 
+        async def apply_one(job) -> bool:
+            job_url = job["jobUrl"]
             logger.info(f"Attempting to apply to: {job.get('title')} at {job.get('company')}")
             
             apply_result = await client.call_tool("apply_to_linkedin_job", {"job_url": job_url})
@@ -58,12 +57,30 @@ async def find_and_apply():
 
             if apply_data.get("status") == "success":
                 logger.info(f"Successfully applied to {job_url}")
-                applied_count += 1
+                return True
             elif apply_data.get("status") == "partial":
                 logger.warning(f"Partially applied to {job_url}: {apply_data.get('message')}")
-                applied_count += 1
+                return True
             else:
                 logger.error(f"Failed to apply to {job_url}: {apply_data.get('message')}")
+                return False
+
+        async def apply_worker():
+            nonlocal applied_count, in_flight
+            while applied_count + in_flight < max_applications:
+                job = next(pending, None)
+                if job is None:
+                    return
+                in_flight += 1
+                try:
+                    if await apply_one(job):
+                        applied_count += 1
+                except Exception as e:
+                    logger.error(f"Error applying to {job['jobUrl']}: {e}")
+                finally:
+                    in_flight -= 1
+
+        await asyncio.gather(*(apply_worker() for _ in range(max_applications)))
     
     logger.info(f"Finished. Applied to {applied_count} jobs.")
 
@@ -4,38 +4,41 @@ Database Models for LinkedIn Job Hunter System
 Defines all database tables and relationships
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy import create_engine, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker, relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 import json
 from typing import Optional, List, Dict, Any
-from sqlalchemy.ext.mutable import MutableList
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for all models"""
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    """ISO string for a datetime column value, None when unset"""
+    return dt.isoformat() if dt is not None else None
 
 class User(Base):
     """User profile and credentials"""
     __tablename__ = 'users'
     
-    id = Column(Integer, primary_key=True)
-    username = Column(String(255), unique=True, nullable=False)
-    email = Column(String(255), unique=True, nullable=True)
-    current_position = Column(String(255), nullable=True)
-    skills = Column(MutableList.as_mutable(JSON), default=list)
-    target_roles = Column(MutableList.as_mutable(JSON), default=list)
-    target_locations = Column(MutableList.as_mutable(JSON), default=list)
-    experience_years = Column(Integer, nullable=True)
-    resume_url = Column(String(500), nullable=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    email: Mapped[Optional[str]] = mapped_column(String(255), unique=True, nullable=True)
+    current_position: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    skills: Mapped[Optional[List[str]]] = mapped_column(JSON, default=list)
+    target_roles: Mapped[Optional[List[str]]] = mapped_column(JSON, default=list)
+    target_locations: Mapped[Optional[List[str]]] = mapped_column(JSON, default=list)
+    experience_years: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    resume_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
     
     # Relationships
-    saved_jobs = relationship("SavedJob", back_populates="user")
-    applied_jobs = relationship("AppliedJob", back_populates="user")
-    session_data = relationship("SessionData", back_populates="user")
-    automation_logs = relationship("AutomationLog", back_populates="user")
+    saved_jobs: Mapped[List["SavedJob"]] = relationship(back_populates="user")
+    applied_jobs: Mapped[List["AppliedJob"]] = relationship(back_populates="user")
+    session_data: Mapped[List["SessionData"]] = relationship(back_populates="user")
+    automation_logs: Mapped[List["AutomationLog"]] = relationship(back_populates="user")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert user to dictionary"""
@@ -49,33 +52,33 @@ class User(Base):
             'target_locations': self.target_locations or [],
             'experience_years': self.experience_years,
             'resume_url': self.resume_url,
-            'created_at': self.created_at.isoformat() if self.created_at is not None else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at is not None else None
+            'created_at': _iso(self.created_at),
+            'updated_at': _iso(self.updated_at)
         }
 
 class SavedJob(Base):
     """Saved jobs for later review"""
     __tablename__ = 'saved_jobs'
     
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    job_id = Column(String(255), nullable=False)  # LinkedIn job ID
-    title = Column(String(500), nullable=False)
-    company = Column(String(255), nullable=False)
-    location = Column(String(255), nullable=True)
-    job_url = Column(String(1000), nullable=False)
-    description = Column(Text, nullable=True)
-    salary_range = Column(String(255), nullable=True)
-    job_type = Column(String(100), nullable=True)  # Full-time, Part-time, Contract
-    experience_level = Column(String(100), nullable=True)  # Entry, Mid, Senior
-    easy_apply = Column(Boolean, default=False)
-    remote_work = Column(Boolean, default=False)
-    saved_at = Column(DateTime, default=func.now())
-    notes = Column(Text, nullable=True)
-    tags = Column(MutableList.as_mutable(JSON), default=list)  # Custom tags for organization
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
+    job_id: Mapped[str] = mapped_column(String(255), nullable=False)  # LinkedIn job ID
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    company: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    job_url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    salary_range: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    job_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Full-time, Part-time, Contract
+    experience_level: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Entry, Mid, Senior
+    easy_apply: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    remote_work: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    saved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now())
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSON, default=list)  # Custom tags for organization
     
     # Relationships
-    user = relationship("User", back_populates="saved_jobs")
+    user: Mapped["User"] = relationship(back_populates="saved_jobs")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert saved job to dictionary"""
@@ -92,7 +95,7 @@ class SavedJob(Base):
             'experience_level': self.experience_level,
             'easy_apply': self.easy_apply,
             'remote_work': self.remote_work,
-            'saved_at': self.saved_at.isoformat() if self.saved_at is not None else None,
+            'saved_at': _iso(self.saved_at),
             'notes': self.notes,
             'tags': self.tags or []
         }
@@ -101,24 +104,24 @@ class AppliedJob(Base):
     """Jobs that have been applied to"""
     __tablename__ = 'applied_jobs'
     
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    job_id = Column(String(255), nullable=False)  # LinkedIn job ID
-    title = Column(String(500), nullable=False)
-    company = Column(String(255), nullable=False)
-    location = Column(String(255), nullable=True)
-    job_url = Column(String(1000), nullable=False)
-    applied_at = Column(DateTime, default=func.now())
-    application_status = Column(String(100), default='applied')  # applied, viewed, interviewing, rejected, accepted
-    cover_letter = Column(Text, nullable=True)
-    resume_used = Column(String(500), nullable=True)
-    follow_up_date = Column(DateTime, nullable=True)
-    notes = Column(Text, nullable=True)
-    response_received = Column(Boolean, default=False)
-    response_date = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
+    job_id: Mapped[str] = mapped_column(String(255), nullable=False)  # LinkedIn job ID
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    company: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    job_url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    applied_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now())
+    application_status: Mapped[Optional[str]] = mapped_column(String(100), default='applied')  # applied, viewed, interviewing, rejected, accepted
+    cover_letter: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    resume_used: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    follow_up_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    response_received: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    response_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
-    user = relationship("User", back_populates="applied_jobs")
+    user: Mapped["User"] = relationship(back_populates="applied_jobs")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert applied job to dictionary"""
@@ -129,43 +132,43 @@ class AppliedJob(Base):
             'company': self.company,
             'location': self.location,
             'job_url': self.job_url,
-            'applied_at': self.applied_at.isoformat() if self.applied_at is not None else None,
+            'applied_at': _iso(self.applied_at),
             'application_status': self.application_status,
             'cover_letter': self.cover_letter,
             'resume_used': self.resume_used,
-            'follow_up_date': self.follow_up_date.isoformat() if self.follow_up_date is not None else None,
+            'follow_up_date': _iso(self.follow_up_date),
             'notes': self.notes,
             'response_received': self.response_received,
-            'response_date': self.response_date.isoformat() if self.response_date is not None else None
+            'response_date': _iso(self.response_date)
         }
 
 class SessionData(Base):
     """Session statistics and data"""
     __tablename__ = 'session_data'
     
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    session_id = Column(String(255), nullable=False)
-    start_time = Column(DateTime, default=func.now())
-    end_time = Column(DateTime, nullable=True)
-    jobs_viewed = Column(Integer, default=0)
-    jobs_applied = Column(Integer, default=0)
-    jobs_saved = Column(Integer, default=0)
-    errors_encountered = Column(Integer, default=0)
-    session_duration = Column(Integer, nullable=True)  # Duration in seconds
-    goals_processed = Column(Integer, default=0)
-    automation_mode = Column(String(100), default='manual')  # manual, automated, hybrid
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
+    session_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    start_time: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now())
+    end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    jobs_viewed: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    jobs_applied: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    jobs_saved: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    errors_encountered: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    session_duration: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # Duration in seconds
+    goals_processed: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    automation_mode: Mapped[Optional[str]] = mapped_column(String(100), default='manual')  # manual, automated, hybrid
     
     # Relationships
-    user = relationship("User", back_populates="session_data")
+    user: Mapped["User"] = relationship(back_populates="session_data")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert session data to dictionary"""
         return {
             'id': self.id,
             'session_id': self.session_id,
-            'start_time': self.start_time.isoformat() if self.start_time is not None else None,
-            'end_time': self.end_time.isoformat() if self.end_time is not None else None,
+            'start_time': _iso(self.start_time),
+            'end_time': _iso(self.end_time),
             'jobs_viewed': self.jobs_viewed,
             'jobs_applied': self.jobs_applied,
             'jobs_saved': self.jobs_saved,
@@ -179,24 +182,24 @@ class AutomationLog(Base):
     """Automation activity logs"""
     __tablename__ = 'automation_logs'
     
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    timestamp = Column(DateTime, default=func.now())
-    action = Column(String(255), nullable=False)
-    details = Column(JSON, nullable=True)  # Accept both dict and list
-    success = Column(Boolean, default=True)
-    error_message = Column(Text, nullable=True)
-    duration_ms = Column(Integer, nullable=True)
-    job_id = Column(String(255), nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now())
+    action: Mapped[str] = mapped_column(String(255), nullable=False)
+    details: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # Accept both dict and list
+    success: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    job_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Relationships
-    user = relationship("User", back_populates="automation_logs")
+    user: Mapped["User"] = relationship(back_populates="automation_logs")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert automation log to dictionary"""
         return {
             'id': self.id,
-            'timestamp': self.timestamp.isoformat() if self.timestamp is not None else None,
+            'timestamp': _iso(self.timestamp),
             'action': self.action,
             'details': self.details,
             'success': self.success,
@@ -209,19 +212,19 @@ class JobRecommendation(Base):
     """AI-generated job recommendations"""
     __tablename__ = 'job_recommendations'
     
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    job_id = Column(String(255), nullable=False)
-    title = Column(String(500), nullable=False)
-    company = Column(String(255), nullable=False)
-    location = Column(String(255), nullable=True)
-    job_url = Column(String(1000), nullable=False)
-    recommendation_score = Column(Integer, nullable=False)  # 1-100 score
-    reasoning = Column(Text, nullable=True)  # AI reasoning for recommendation
-    skills_match = Column(MutableList.as_mutable(JSON), default=list)  # Matching skills
-    created_at = Column(DateTime, default=func.now())
-    viewed = Column(Boolean, default=False)
-    applied = Column(Boolean, default=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
+    job_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    company: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    job_url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    recommendation_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 1-100 score
+    reasoning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # AI reasoning for recommendation
+    skills_match: Mapped[Optional[List[str]]] = mapped_column(JSON, default=list)  # Matching skills
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now())
+    viewed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    applied: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job recommendation to dictionary"""
@@ -235,7 +238,7 @@ class JobRecommendation(Base):
             'recommendation_score': self.recommendation_score,
             'reasoning': self.reasoning,
             'skills_match': self.skills_match or [],
-            'created_at': self.created_at.isoformat() if self.created_at is not None else None,
+            'created_at': _iso(self.created_at),
             'viewed': self.viewed,
             'applied': self.applied
         }
@@ -244,12 +247,12 @@ class SystemSettings(Base):
     """System configuration and settings"""
     __tablename__ = 'system_settings'
     
-    id = Column(Integer, primary_key=True)
-    setting_key = Column(String(255), unique=True, nullable=False)
-    setting_value = Column(Text, nullable=True)
-    setting_type = Column(String(50), default='string')  # string, integer, boolean, json
-    description = Column(Text, nullable=True)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    setting_key: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    setting_value: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    setting_type: Mapped[Optional[str]] = mapped_column(String(50), default='string')  # string, integer, boolean, json
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert system setting to dictionary"""
@@ -259,5 +262,5 @@ class SystemSettings(Base):
             'setting_value': self.setting_value,
             'setting_type': self.setting_type,
             'description': self.description,
-            'updated_at': self.updated_at.isoformat() if self.updated_at is not None else None
+            'updated_at': _iso(self.updated_at)
         }
\ No newline at end of file
@@ -6,7 +6,7 @@ Handles database connections, sessions, and operations
 
 import os
 import logging
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, text, inspect, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
@@ -43,6 +43,7 @@ class DatabaseManager:
                 echo=False,  # Set to True for SQL query logging
                 pool_pre_ping=True
             )
+            event.listen(self.engine, "connect", self._set_sqlite_pragmas)
             
             # Create session factory
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
@@ -59,6 +60,16 @@ class DatabaseManager:
             logger.log_error(f"Failed to initialize database: {e}")
             raise
 
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Per-connection SQLite settings for the write-heavy logging path"""
+        # WAL lets readers run alongside the log writer, and NORMAL sync only
+        # fsyncs at checkpoints, which WAL keeps crash-safe
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
     def _verify_schema(self):
         """Verify and update the database schema."""
         inspector = inspect(self.engine)
@@ -70,7 +81,8 @@ class DatabaseManager:
                 'id': 'INTEGER', 'username': 'VARCHAR(255)', 'email': 'VARCHAR(255)',
                 'password_hash': 'VARCHAR(255)', 'created_at': 'DATETIME', 'updated_at': 'DATETIME',
                 'full_name': 'VARCHAR', 'current_position': 'VARCHAR(255)',
-                'skills': 'JSON', 'experience_years': 'INTEGER', 'resume_url': 'VARCHAR(500)'
+                'skills': 'JSON', 'experience_years': 'INTEGER', 'resume_url': 'VARCHAR(500)',
+                'resume_word_count': 'INTEGER'
             }
 
             for col_name, col_type in expected_user_columns.items():
@@ -79,6 +91,12 @@ class DatabaseManager:
                     # Use execute with text for safety
                     connection.execute(text(f'ALTER TABLE users ADD COLUMN {col_name} {col_type}'))
             
+            # create_all() skips indexes on tables that already exist, so add any
+            # declared index missing from an older database
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=connection, checkfirst=True)
+            
             # Commit the changes after altering the table
             connection.commit()
             
@@ -163,6 +181,20 @@ class DatabaseManager:
             logger.log_error(f"Failed to update user: {e}")
             return False
 
+    def update_resume_word_count(self, resume_url: str, word_count: int) -> bool:
+        """Record the extracted word count for the user whose current resume is resume_url"""
+        try:
+            with self.get_session() as session:
+                user = session.query(User).filter(User.resume_url == resume_url).first()
+                if not user:
+                    # Resume was replaced before extraction finished
+                    return False
+                user.resume_word_count = word_count
+                return True
+        except Exception as e:
+            logger.log_error(f"Failed to update resume word count: {e}")
+            return False
+
     # --- New ScrapedJob Management ---
 
     def add_scraped_job(self, user_id: int, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -335,6 +367,30 @@ class DatabaseManager:
             logger.log_error(f"Failed to log action: {e}", e)
             return False
     
+    def log_automation_actions_bulk(self, entries: List[Dict[str, Any]]) -> bool:
+        """Log several automation actions in one transaction (executemany)"""
+        if not entries:
+            return True
+        try:
+            rows = [{
+                'user_id': entry['user_id'],
+                'action': entry['action'],
+                'timestamp': entry.get('timestamp') or datetime.now(),
+                'details': entry.get('details'),
+                'success': entry.get('success', True),
+                'error_message': entry.get('error_message'),
+                'duration_ms': entry.get('duration_ms'),
+                'job_id': entry.get('job_id')
+            } for entry in entries]
+            with self.get_session() as session:
+                # Core insert with a parameter list: one executemany, no ORM objects
+                session.execute(AutomationLog.__table__.insert(), rows)
+            logger.log_info(f"Logged {len(rows)} actions in bulk")
+            return True
+        except Exception as e:
+            logger.log_error(f"Failed to log actions in bulk: {e}", e)
+            return False
+    
     def get_automation_logs(self, user_id: int, limit: int = 100) -> List[Dict[str, Any]]:
         """Get automation logs for user as list of dicts"""
         try:
@@ -12,16 +12,19 @@ from typing import List, Dict, Any, Optional
 
 from sqlalchemy import (
     create_engine, Column, Integer, String, DateTime, Boolean, Text, JSON, ForeignKey,
-    inspect
+    Index, inspect
 )
 from sqlalchemy.orm import sessionmaker, relationship, declarative_base
-from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.sql import func
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    """ISO string for a datetime column value, None when unset"""
+    return dt.isoformat() if dt is not None else None
+
 # Define the base class for declarative models
 Base = declarative_base()
 
@@ -42,9 +45,10 @@ class User(Base):
     # Profile Information
     full_name = Column(String)
     current_position = Column(String(255), nullable=True)
-    skills = Column(MutableList.as_mutable(JSON), default=list)
+    skills = Column(JSON, default=list)
     experience_years = Column(Integer, nullable=True)
     resume_url = Column(String(500), nullable=True)
+    resume_word_count = Column(Integer, nullable=True)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -56,8 +60,9 @@ class User(Base):
             'skills': self.skills,
             'experience_years': self.experience_years,
             'resume_url': self.resume_url,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'resume_word_count': self.resume_word_count,
+            'created_at': _iso(self.created_at),
+            'updated_at': _iso(self.updated_at),
         }
 
 # DEPRECATION NOTE: The SavedJob and AppliedJob tables are being deprecated for the
@@ -86,7 +91,7 @@ class User(Base):
 #     remote_work = Column(Boolean, default=False)
 #     saved_at = Column(DateTime, default=func.now())
 #     notes = Column(Text, nullable=True)
-#     tags = Column(MutableList.as_mutable(JSON), default=list)  # Custom tags for organization
+#     tags = Column(JSON, default=list)  # Custom tags for organization
 #     
 #     # Relationships
 #     user = relationship("User", back_populates="saved_jobs")
@@ -156,6 +161,12 @@ class User(Base):
 class ScrapedJob(Base):
     """Jobs scraped from LinkedIn"""
     __tablename__ = 'scraped_jobs'
+    __table_args__ = (
+        # Status listings/counts filter on (user_id, status) and sort by scraped_at
+        Index('ix_scraped_jobs_user_status_scraped', 'user_id', 'status', 'scraped_at'),
+        # Duplicate check before every insert
+        Index('ix_scraped_jobs_job_url', 'job_url'),
+    )
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     job_id = Column(String(255), unique=True, nullable=False)
@@ -194,11 +205,11 @@ class ScrapedJob(Base):
             'description': self.description,
             'job_url': self.job_url,  # Changed from 'url' to 'job_url'
             'status': self.status,
-            'scraped_at': self.scraped_at.isoformat() if self.scraped_at else None,  # Changed from 'created_at'
+            'scraped_at': _iso(self.scraped_at),  # Changed from 'created_at'
             'easy_apply': self.easy_apply,
-            'status_updated_at': self.status_updated_at.isoformat() if self.status_updated_at else None,
+            'status_updated_at': _iso(self.status_updated_at),
             'error_message': self.error_message,
-            'applied_at': self.applied_at.isoformat() if self.applied_at else None,
+            'applied_at': _iso(self.applied_at),
             'salary_range': self.salary_range,
             'job_type': self.job_type,
             'experience_level': self.experience_level,
@@ -232,8 +243,8 @@ class SessionData(Base):
         return {
             'id': self.id,
             'session_id': self.session_id,
-            'start_time': self.start_time.isoformat() if self.start_time is not None else None,
-            'end_time': self.end_time.isoformat() if self.end_time is not None else None,
+            'start_time': _iso(self.start_time),
+            'end_time': _iso(self.end_time),
             'jobs_viewed': self.jobs_viewed,
             'jobs_applied': self.jobs_applied,
             'jobs_saved': self.jobs_saved,
@@ -246,6 +257,9 @@ class SessionData(Base):
 class AutomationLog(Base):
     """Automation activity logs"""
     __tablename__ = 'automation_logs'
+    __table_args__ = (
+        Index('ix_automation_logs_user_timestamp', 'user_id', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -264,7 +278,7 @@ class AutomationLog(Base):
         """Convert automation log to dictionary"""
         return {
             'id': self.id,
-            'timestamp': self.timestamp.isoformat() if self.timestamp is not None else None,
+            'timestamp': _iso(self.timestamp),
             'action': self.action,
             'details': self.details,
             'success': self.success,
@@ -276,6 +290,9 @@ class AutomationLog(Base):
 class JobRecommendation(Base):
     """AI-generated job recommendations"""
     __tablename__ = 'job_recommendations'
+    __table_args__ = (
+        Index('ix_job_recommendations_user_score', 'user_id', 'recommendation_score'),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -286,7 +303,7 @@ class JobRecommendation(Base):
     job_url = Column(String(1000), nullable=False)
     recommendation_score = Column(Integer, nullable=False)  # 1-100 score
     reasoning = Column(Text, nullable=True)  # AI reasoning for recommendation
-    skills_match = Column(MutableList.as_mutable(JSON), default=list)  # Matching skills
+    skills_match = Column(JSON, default=list)  # Matching skills
     created_at = Column(DateTime, default=func.now())
     viewed = Column(Boolean, default=False)
     applied = Column(Boolean, default=False)
@@ -303,7 +320,7 @@ class JobRecommendation(Base):
             'recommendation_score': self.recommendation_score,
             'reasoning': self.reasoning,
             'skills_match': self.skills_match or [],
-            'created_at': self.created_at.isoformat() if self.created_at is not None else None,
+            'created_at': _iso(self.created_at),
             'viewed': self.viewed,
             'applied': self.applied
         }
@@ -327,5 +344,5 @@ class SystemSettings(Base):
             'setting_value': self.setting_value,
             'setting_type': self.setting_type,
             'description': self.description,
-            'updated_at': self.updated_at.isoformat() if self.updated_at is not None else None
+            'updated_at': _iso(self.updated_at)
         } 
\ No newline at end of file
@@ -461,15 +461,24 @@ class JobAutomationOrchestrator:
         self.stats = JobAutomationStats()  # Reset stats
         
         try:
-            # Test connection first
+            # Test the connection while the search is already in flight; the
+            # search result is discarded if the connection test fails
             self.logger.log_info("Testing LinkedIn connection...")
-            connection_ok = await self.job_search_service.test_connection()
+            self.logger.log_info(f"Searching for jobs: '{search_criteria.query}' in '{search_criteria.location}'")
+            search_task = asyncio.create_task(self.job_search_service.search_jobs(search_criteria))
+            try:
+                connection_ok = await self.job_search_service.test_connection()
+            except BaseException:
+                search_task.cancel()
+                # Let the cancellation land and retrieve any exception the search already raised
+                await asyncio.gather(search_task, return_exceptions=True)
+                raise
             if not connection_ok:
+                search_task.cancel()
+                await asyncio.gather(search_task, return_exceptions=True)
                 raise JobSearchError("LinkedIn connection test failed")
             
-            # Perform job search
-            self.logger.log_info(f"Searching for jobs: '{search_criteria.query}' in '{search_criteria.location}'")
-            jobs = await self.job_search_service.search_jobs(search_criteria)
+            jobs = await search_task
             
             self.stats.jobs_searched = len(jobs)
             self.logger.log_info(f"Found {len(jobs)} jobs from search")
@@ -721,7 +730,7 @@ class JobAutomationOrchestrator:
 # Optionally, add a mode to run the orchestrator in enqueue mode
 async def run_reconnaissance_phase_enqueue(self, search_criteria: SearchCriteria):
     await self.enqueue_scrape_job(search_criteria)
-    return {'status': 'enqueued', 'message': 'Scrape job enqueued', 'criteria': search_criteria.__dict__}
+    return {'status': 'enqueued', 'message': 'Scrape job enqueued', 'criteria': search_criteria.to_dict()}
 
 async def run_application_phase_enqueue(self, job_id: str, resume: str = ""):
     await self.enqueue_apply_job(job_id, resume)
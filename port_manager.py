@@ -15,6 +15,12 @@ def find_available_port(start_port: int, host: str = '127.0.0.1') -> int:
                 return port
             port += 1
 
+def find_ephemeral_port(host: str = '127.0.0.1') -> int:
+    """Lets the kernel pick a free TCP port; for callers that don't need a specific one."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
 def load_port_assignments():
     if PORT_ASSIGNMENTS_FILE.exists():
         try:
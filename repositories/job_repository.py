@@ -5,7 +5,7 @@ import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from core.models.job_data import JobData, JobStatus
+from core.models.job_data import JobData, JobStatus, parse_job_status
 from legacy.database.database import DatabaseManager
 
 
@@ -72,14 +72,7 @@ class JobRepository:
             raw_jobs = self.db.get_jobs_by_status(user_id, status.value, limit)
             
             # Convert to JobData objects
-            jobs = []
-            for raw_job in raw_jobs:
-                try:
-                    job_data = self._convert_db_job(raw_job)
-                    jobs.append(job_data)
-                except Exception as e:
-                    self.logger.warning(f"Failed to convert job data: {e}")
-                    continue
+            jobs = self._convert_db_jobs(raw_jobs)
             
             self.logger.info(f"Retrieved {len(jobs)} jobs with status {status.value}")
             return jobs
@@ -176,16 +169,7 @@ class JobRepository:
         try:
             raw_jobs = self.db.get_recent_jobs(user_id, days, limit)
             
-            jobs = []
-            for raw_job in raw_jobs:
-                try:
-                    job_data = self._convert_db_job(raw_job)
-                    jobs.append(job_data)
-                except Exception as e:
-                    self.logger.warning(f"Failed to convert job data: {e}")
-                    continue
-            
-            return jobs
+            return self._convert_db_jobs(raw_jobs)
             
         except Exception as e:
             self.logger.error(f"Failed to get recent jobs: {e}")
@@ -211,6 +195,23 @@ class JobRepository:
             self.logger.error(f"Failed to delete job {job_id}: {e}")
             return False
     
+    def _convert_db_jobs(self, raw_jobs: List[Dict[str, Any]]) -> List[JobData]:
+        """Convert database job records in bulk, skipping any that fail to convert"""
+        # Same defaults as _convert_db_job: a missing/empty status means scraped
+        rows = [dict(raw_job, status=raw_job.get('status') or JobStatus.SCRAPED.value)
+                for raw_job in raw_jobs]
+        try:
+            return JobData.from_dicts(rows)
+        except Exception:
+            # One bad record fails the whole batch; convert one by one so only it is skipped
+            jobs = []
+            for raw_job in raw_jobs:
+                try:
+                    jobs.append(self._convert_db_job(raw_job))
+                except Exception as e:
+                    self.logger.warning(f"Failed to convert job data: {e}")
+            return jobs
+    
     def _convert_db_job(self, raw_job: Dict[str, Any]) -> JobData:
         """Convert database job record to JobData object"""
         try:
@@ -226,7 +227,7 @@ class JobRepository:
             
             # Handle status
             status_str = raw_job.get('status', JobStatus.SCRAPED.value)
-            status = JobStatus(status_str) if status_str else JobStatus.SCRAPED
+            status = parse_job_status(status_str) if status_str else JobStatus.SCRAPED
             
             # Handle tags - not stored in current schema
             tags = []
@@ -375,7 +375,7 @@ def test_resume_upload_valid_pdf():
     data = response.json()
     assert data["success"]
     assert data["filename"] == "test_resume.pdf"
-    assert data["word_count"] > 0
+    assert data["word_count"] is None  # counted in the background for binary formats
 
 def test_resume_upload_valid_docx():
     """Test uploading a valid DOCX resume"""
@@ -3,8 +3,9 @@
 Test script for centralized logging system
 """
 
+import os
 import time
-from centralized_logging import get_logger, log_manager
+from centralized_logging import get_logger, log_manager, LOGS_DIR, LogManager
 
 def test_logging():
     """Test the logging system"""
@@ -48,5 +49,62 @@ def test_logging():
     
     print("\n✅ Logging system test completed!")
 
+def test_log_file_written():
+    """Records reach the main, error and audit log files on disk"""
+    print("Testing log file output...")
+    
+    service = f"file_output_test_{int(time.time() * 1000)}"
+    logger = get_logger(service)
+    logger.log_info("File output info ✅")
+    logger.log_error("File output error")
+    logger.log_audit("file_output_action", "test_user")
+    # Stops the listener, flushing the batched records to disk
+    logger.close()
+    
+    name = service.lower()
+    main_log = (LOGS_DIR / f"{name}.log").read_text(encoding='utf-8')
+    error_log = (LOGS_DIR / f"{name}_errors.log").read_text(encoding='utf-8')
+    audit_log = (LOGS_DIR / f"{name}_audit.log").read_text(encoding='utf-8')
+    
+    assert "File output info ✅" in main_log
+    assert "File output error" in error_log
+    assert "file_output_action" in audit_log
+    
+    for suffix in ("", "_errors", "_audit"):
+        (LOGS_DIR / f"{name}{suffix}.log").unlink()
+    
+    print("✅ Log file output test completed")
+
+def test_log_file_written_after_fork_and_shutdown():
+    """Records logged without a running listener thread still reach the log file"""
+    print("Testing log file output after fork and shutdown...")
+    
+    manager = LogManager()
+    service = f"no_listener_test_{int(time.time() * 1000)}"
+    logger = manager.get_logger(service)
+    log_path = LOGS_DIR / f"{service.lower()}.log"
+    
+    if hasattr(os, "fork"):
+        pid = os.fork()
+        if pid == 0:
+            # The child does not inherit the parent's listener thread
+            try:
+                logger.log_info("Logged in forked child")
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        assert "Logged in forked child" in log_path.read_text(encoding='utf-8')
+    
+    manager.shutdown()
+    logger.log_info("Logged after shutdown")
+    assert "Logged after shutdown" in log_path.read_text(encoding='utf-8')
+    
+    for suffix in ("", "_errors", "_audit"):
+        (LOGS_DIR / f"{service.lower()}{suffix}.log").unlink()
+    
+    print("✅ Log file output after fork and shutdown test completed")
+
 if __name__ == "__main__":
-    test_logging() 
\ No newline at end of file
+    test_logging()
+    test_log_file_written()
+    test_log_file_written_after_fork_and_shutdown() 
\ No newline at end of file